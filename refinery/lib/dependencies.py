@@ -99,24 +99,30 @@ class LazyDependency(Generic[Mod]):
 class DependencyAccessor(Generic[Mod]):
     """
     Methods decorated with `refinery.lib.dependencies.dependency_accessor` turn into objects of
-    this type. See the description of this decorator for more details.
+    this type. See the description of this decorator for more details. When accessed through a
+    unit instance, the module is also stored in the instance dictionary, so that subsequent lookups
+    on the same instance do not go through the accessor.
     """
     def __init__(self, dependency: LazyDependency[Mod]):
         self.dependency = dependency
         self.parent = None
         self.module = None
+        self.name = None
 
-    def __get__(self, _: Unit | None, unit: type[Unit] | None = None):
+    def __get__(self, instance: Unit | None, unit: type[Unit] | None = None):
         if (mod := self.module) is None:
             if unit is None:
                 unit = self.parent
             dependency = self.dependency
             dependency.register(unit)
             self.module = mod = dependency()
+        if instance is not None and (name := self.name):
+            instance.__dict__[name] = mod
         return mod
 
     def __set_name__(self, unit: type[Unit], name: str):
         self.parent = unit
+        self.name = name
         self.dependency.register(unit)
 
 
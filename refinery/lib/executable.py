@@ -10,7 +10,6 @@ The provided interface is the same for all executables. It powers the following
 from __future__ import annotations
 
 import codecs
-import itertools
 
 from abc import ABC, abstractmethod
 from enum import Enum
@@ -573,11 +572,15 @@ class Executable(ABC):
             raise RuntimeError(F'The computed address space upper bound 0x{upper:X} is less than the computed lower bound 0x{lower:X}.')
         return Range(lower, upper)
 
+    @lru_cache
+    def _compartments(self) -> tuple[Section | Segment, ...]:
+        return (*self.sections(), *self.segments())
+
     def lookup_location(self, location: int, lt: LT) -> Location:
         """
         For a address or file offset, compute the corresponding `refinery.lib.executable.Location`.
         """
-        for part in itertools.chain(self.sections(), self.segments()):
+        for part in self._compartments():
             phys = part.physical
             virt = part.virtual
             if lt is LT.PHYSICAL and location in phys:
@@ -0,0 +1,64 @@
+"""
+Pure-Python implementation of the XXTEA variant that uses an arithmetic rather than a logical
+shift right in its mixing function. The Cython module of the same name replaces these routines
+with native 32-bit integer arithmetic when it is available.
+"""
+from __future__ import annotations
+
+_DELTA: int = 0x9E3779B9
+_MASK32: int = 0xFFFFFFFF
+
+
+def asr(value: int, shift: int) -> int:
+    """
+    Perform an arithmetic shift right on the given value, which is treated as a signed 32-bit
+    integer. Source: https://blog.xlab.qianxin.com/long-live-the-vo1d_botnet/#34-mzmess-plugins
+    """
+    return (value - ((value & 0x80000000) << 1)) >> shift & _MASK32
+
+
+def _check_block_size(m: int, n: int):
+    if n <= 0 or m % n:
+        raise ValueError(F'The input of length {m} cannot be split into blocks of {n} words.')
+
+
+def xxtea_asr_encrypt(key: list[int], v: list[int], n: int) -> list[int]:
+    """
+    Encrypt the words in `v` in place as consecutive blocks of `n` words each.
+    """
+    _check_block_size(len(v), n)
+    r = 6 + 52 // n
+    nxt = [*range(1, n), 0]
+    for b in range(0, len(v), n):
+        s = 0
+        z = v[b + n - 1]
+        for _ in range(r):
+            s = s + _DELTA & _MASK32
+            e = (s >> 2) & 3
+            for p in range(n):
+                y = v[b + nxt[p]]
+                k = (p & 3) ^ e
+                x = (asr(z, 5) ^ (y << 2)) + (asr(y, 3) ^ (z << 4)) ^ (s ^ y) + (key[k] ^ z)
+                z = v[b + p] = v[b + p] + x & _MASK32
+    return v
+
+
+def xxtea_asr_decrypt(key: list[int], v: list[int], n: int) -> list[int]:
+    """
+    Decrypt the words in `v` in place as consecutive blocks of `n` words each.
+    """
+    _check_block_size(len(v), n)
+    r = 6 + 52 // n
+    prv = [n - 1, *range(n - 1)]
+    for b in range(0, len(v), n):
+        s = r * _DELTA & _MASK32
+        y = v[b]
+        for _ in range(r):
+            e = (s >> 2) & 3
+            for p in range(n - 1, -1, -1):
+                z = v[b + prv[p]]
+                k = (p & 3) ^ e
+                x = (asr(z, 5) ^ (y << 2)) + (asr(y, 3) ^ (z << 4)) ^ (s ^ y) + (key[k] ^ z)
+                y = v[b + p] = v[b + p] - x & _MASK32
+            s = s - _DELTA & _MASK32
+    return v
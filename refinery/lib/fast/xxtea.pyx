@@ -0,0 +1,96 @@
+# cython: language_level=3
+# cython: boundscheck=False
+# cython: wraparound=False
+# cython: cdivision=True
+cimport cython
+
+from libc.stdint cimport int32_t, uint32_t
+from libc.stdlib cimport free, malloc
+
+cdef uint32_t DELTA = 0x9E3779B9UL
+
+
+cdef inline uint32_t asr(uint32_t value, int shift) nogil:
+    return <uint32_t>((<int32_t>value) >> shift)
+
+
+def xxtea_asr_encrypt(key, list v, Py_ssize_t n):
+    cdef:
+        Py_ssize_t m = len(v)
+        Py_ssize_t b, p
+        int i
+        uint32_t k[4]
+        uint32_t *w
+        uint32_t *u
+        uint32_t s, x, y, z, e
+        int r
+    if n <= 0 or m % n:
+        raise ValueError(F'The input of length {m} cannot be split into blocks of {n} words.')
+    r = 6 + 52 // n
+    w = <uint32_t *>malloc(m * sizeof(uint32_t))
+    if w == NULL:
+        raise MemoryError
+    try:
+        for p in range(4):
+            k[p] = key[p]
+        for p in range(m):
+            w[p] = v[p]
+        with nogil:
+            for b in range(m // n):
+                u = w + b * n
+                s = 0
+                z = u[n - 1]
+                for i in range(r):
+                    s += DELTA
+                    e = (s >> 2) & 3
+                    for p in range(n):
+                        y = u[p + 1] if p + 1 < n else u[0]
+                        x = (asr(z, 5) ^ (y << 2)) + (asr(y, 3) ^ (z << 4)) ^ (s ^ y) + (k[(p & 3) ^ e] ^ z)
+                        u[p] += x
+                        z = u[p]
+        for p in range(m):
+            v[p] = w[p]
+    finally:
+        free(w)
+    return v
+
+
+def xxtea_asr_decrypt(key, list v, Py_ssize_t n):
+    cdef:
+        Py_ssize_t m = len(v)
+        Py_ssize_t b, p
+        int i
+        uint32_t k[4]
+        uint32_t *w
+        uint32_t *u
+        uint32_t s, x, y, z, e
+        int r
+    if n <= 0 or m % n:
+        raise ValueError(F'The input of length {m} cannot be split into blocks of {n} words.')
+    r = 6 + 52 // n
+    w = <uint32_t *>malloc(m * sizeof(uint32_t))
+    if w == NULL:
+        raise MemoryError
+    try:
+        for p in range(4):
+            k[p] = key[p]
+        for p in range(m):
+            w[p] = v[p]
+        with nogil:
+            for b in range(m // n):
+                u = w + b * n
+                s = <uint32_t>r * DELTA
+                y = u[0]
+                for i in range(r):
+                    e = (s >> 2) & 3
+                    for p in range(n - 1, -1, -1):
+                        z = u[p - 1] if p > 0 else u[n - 1]
+                        x = (asr(z, 5) ^ (y << 2)) + (asr(y, 3) ^ (z << 4)) ^ (s ^ y) + (k[(p & 3) ^ e] ^ z)
+                        u[p] -= x
+                        y = u[p]
+                    s -= DELTA
+        for p in range(m):
+            v[p] = w[p]
+    finally:
+        free(w)
+    return v
@@ -837,36 +837,29 @@ def ascii_view(
         return memoryview(data)[encoding.lsb:len(data):encoding.step]
 
 
+EmailHeaderPattern = re.compile(
+    BR'\n(Received:\x20from|Subject:\x20|To:\x20|From:\x20|Message-ID:\x20|Bcc:\x20'
+    BR'|Content-Transfer-Encoding:\x20|Content-Type:\x20|Return-Path:\x20)')
+
+
 def is_likely_eml(
     data: buf,
     window_size: int = 0x10000,
     text_checked: bool = False,
 ):
     """
-    Checks the input for common strings that occur as email headers. If at least two are found,
-    the function returns True.
+    Checks the input for common strings that occur as email headers. If at least two different ones
+    are found, the function returns True. All headers are located in a single pass over the input.
     """
-    hits = 0
     view = memoryview(data)[:window_size]
-    if not text_checked and get_text_format(view) is None:
-        return False
-    for marker in (
-        b'\nReceived:\x20from',
-        b'\nSubject:\x20',
-        b'\nTo:\x20',
-        b'\nFrom:\x20',
-        b'\nMessage-ID:\x20',
-        b'\nBcc:\x20',
-        b'\nContent-Transfer-Encoding:\x20',
-        b'\nContent-Type:\x20',
-        b'\nReturn-Path:\x20',
-    ):
-        if not buffer_contains(view, marker):
-            continue
-        if (hits := hits + 1) >= 2:
-            return True
-    else:
-        return False
+    if not view.contiguous:
+        view = memoryview(bytearray(view))
+    hits = set()
+    for match in EmailHeaderPattern.finditer(view):
+        hits.add(match[1])
+        if len(hits) >= 2:
+            return text_checked or guess_text_encoding(view) is not None
+    return False
 
 
 def is_likely_vbe(data: buf):
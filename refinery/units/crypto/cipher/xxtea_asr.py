@@ -1,54 +1,30 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-from typing import Sequence, Optional
+from __future__ import annotations
 
-from refinery.units.crypto.cipher.tea import TEAUnit, TEABase, tea_block_operation, Arg
-from refinery.lib.crypto import BlockCipherFactory, CipherInterface, BufferType, CipherMode
+from typing import Sequence
 
+from refinery.lib.chunks import pack, unpack
+from refinery.lib.crypto import ECB, BlockCipherFactory, BufferType, CipherInterface, Operation
+from refinery.lib.fast.xxtea import xxtea_asr_decrypt, xxtea_asr_encrypt
+from refinery.lib.types import Param
+from refinery.units.crypto.cipher.tea import Arg, StandardBlockCipherUnit, TEAUnit
+from refinery.units.crypto.cipher.xxtea import XXTEA
 
-class XXTEA_ASR(TEABase):
 
-    def __init__(
-        self,
-        key: BufferType,
-        mode: Optional[CipherMode],
-        big_endian: bool = False,
-        block_size: int = TEABase.block_size
-    ):
-        self.block_size = block_size
-        super().__init__(key, mode, big_endian)
+class XXTEA_ASR(XXTEA):
+
+    def tea_encrypt(self, key: Sequence[int], v: Sequence[int]) -> Sequence[int]:
+        return xxtea_asr_encrypt(list(key), list(v), len(v))
 
-    @tea_block_operation
-    def block_encrypt(key: Sequence[int], v: Sequence[int]) -> Sequence[int]:
-        n = len(v)
-        s = 0
-        r = 6 + 52 // n
-        z = v[n - 1]
-        for _ in range(r):
-            s = s + 0x9E3779B9 & 0xFFFFFFFF
-            e = (s >> 2) & 3
-            for p in range(n):
-                y = v[(p + 1) % n]
-                k = (p & 3) ^ e
-                x = (asr(z, 5) ^ (y << 2)) + (asr(y, 3) ^ (z << 4)) ^ (s ^ y) + (key[k] ^ z)
-                z = v[p] = v[p] + x & 0xFFFFFFFF
-        return v
+    def tea_decrypt(self, key: Sequence[int], v: Sequence[int]) -> Sequence[int]:
+        return xxtea_asr_decrypt(list(key), list(v), len(v))
 
-    @tea_block_operation
-    def block_decrypt(key: Sequence[int], v: Sequence[int]) -> Sequence[int]:
-        n = len(v)
-        r = 6 + 52 // n
-        s = r * 0x9E3779B9 & 0xFFFFFFFF
-        y = v[0]
-        for _ in range(r):
-            e = (s >> 2) & 3
-            for p in range(n - 1, -1, -1):
-                z = v[(p - 1) % n]
-                k = (p & 3) ^ e
-                x = (asr(z, 5) ^ (y << 2)) + (asr(y, 3) ^ (z << 4)) ^ (s ^ y) + (key[k] ^ z)
-                y = v[p] = v[p] - x & 0xFFFFFFFF
-            s = s - 0x9E3779B9 & 0xFFFFFFFF
-        return v
+    def _apply_blockwise(self, operation: Operation, data: BufferType) -> BufferType:
+        if not isinstance(self.mode, ECB) or len(data) % self.block_size:
+            return super()._apply_blockwise(operation, data)
+        be = self.big_endian
+        kernel = xxtea_asr_encrypt if operation is Operation.Encrypt else xxtea_asr_decrypt
+        words = kernel(list(self.derived_key), list(unpack(data, 4, be)), self.block_size // 4)
+        return pack(words, 4, be)
 
 
 class xxtea_asr(TEAUnit, cipher=BlockCipherFactory(XXTEA_ASR)):
@@ -57,14 +33,15 @@ class xxtea_asr(TEAUnit, cipher=BlockCipherFactory(XXTEA_ASR)):
 
     def __init__(
         self, key, iv=b'', padding=None, mode=None, raw=False, swap=False,
-        block_size: Arg.Number('-b', help=(
+        block_size: Param[int, Arg.Number('-b', help=(
             'Cipher block size in 32-bit words. The default value {default} implies that the input '
-            'is treated as a single block, which is common behaviour of many implementations.')) = 1
+            'is treated as a single block, which is common behaviour of many implementations.'))] = 1
     ):
-        super().__init__(key, iv, padding, mode, raw, swap=swap, block_size=block_size)
+        super().__init__(
+            key, iv=iv, padding=padding, mode=mode, raw=raw, swap=swap, block_size=block_size)
 
     def _prepare_block(self, data: bytes):
-        if self.args.block_size < 2:
+        if self.args.block_size <= 1:
             blocks, remainder = divmod(len(data), 4)
             if remainder:
                 blocks += 1
@@ -81,18 +58,5 @@ class xxtea_asr(TEAUnit, cipher=BlockCipherFactory(XXTEA_ASR)):
         return super().decrypt(data)
 
     def _new_cipher(self, **optionals) -> CipherInterface:
-        return super()._new_cipher(block_size=self.block_size, **optionals)
-
-
-def asr(value, shift):
-    """
-    Source: https://blog.xlab.qianxin.com/long-live-the-vo1d_botnet/#34-mzmess-plugins
-    Perform an arithmetic shift right (ASR) operation.
-    :param value: The signed 32-bit integer (treated as 32-bit)
-    :param shift: The number of positions to shift.
-    :return: The result of the arithmetic shift right.
-    """
-    if value & 0x80000000:  # Check if MSB is set (negative number)
-        return (value >> shift) | (0xFFFFFFFF << (32 - shift)) & 0xFFFFFFFF
-    else:
-        return value >> shift
\ No newline at end of file
+        return StandardBlockCipherUnit._new_cipher(self,
+            big_endian=self.args.swap, block_size=self.block_size, **optionals)
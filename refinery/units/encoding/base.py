@@ -16,6 +16,20 @@ _LARGER_ALPHABETS = {
 }
 
 
+def _limb(base: int):
+    """
+    Return the largest number of digits in the given base that fit into a 30-bit limb, together
+    with the value of the base raised to that power. Converting one limb at a time keeps all but
+    one arithmetic operation per limb on small integers.
+    """
+    width = 1
+    limb = base
+    while limb * base < 0x40000000:
+        limb *= base
+        width += 1
+    return width, limb
+
+
 class base(Unit):
     """
     Encodes and decodes integers in arbitrary base. A generic binary-to-text encoding using a
@@ -73,12 +87,19 @@ class base(Unit):
             logBn += 1
         result = bytearray()
         no_pad = self.args.strip_padding
+        width, limb = _limb(base)
 
-        for _ in range(logBn):
-            number, k = divmod(number, base)
-            result.append(alphabet[k])
-            if no_pad and number <= 0:
-                break
+        while logBn > 0:
+            number, block = divmod(number, limb)
+            for _ in range(min(width, logBn)):
+                block, k = divmod(block, base)
+                result.append(alphabet[k])
+                if no_pad and not block and not number:
+                    break
+            else:
+                logBn -= width
+                continue
+            break
 
         result.reverse()
         return result
@@ -123,11 +144,19 @@ class base(Unit):
         else:
             if len(data) > 100_000:
                 self.log_warn('long alphabet & unable to use built-ins; reverting to (slow) fallback.')
+            lookup = bytearray(B'\xFF' * 256)
+            for k, digit in enumerate(alphabet):
+                lookup[digit] = k
+            digits = data.translate(lookup)
+            if base < 0x100 and 0xFF in digits:
+                raise ValueError('the input contains digits that are not part of the alphabet')
+            width, limb = _limb(base)
             result = 0
-            lookup = {digit: k for k, digit in enumerate(alphabet)}
-            for digit in data:
-                result *= base
-                result += lookup[digit]
+            for k in range(len(digits) % width - width, len(digits), width):
+                block = 0
+                for digit in digits[max(k, 0):k + width]:
+                    block = block * base + digit
+                result = result * limb + block
         if not base or self.args.strip_padding:
             size, r = divmod(result.bit_length(), 8)
             size += int(bool(r))
@@ -3,7 +3,7 @@ from __future__ import annotations
 import email.utils
 import re
 
-from email.parser import Parser
+from email.parser import BytesParser, Parser
 from typing import Iterable
 
 from refinery.lib import json
@@ -21,13 +21,18 @@ class xtmail(PathExtractorUnit):
     Extract files and body from EMail messages. The unit supports both the Outlook message format
     and regular MIME documents.
     """
+    _LEADING_SPACES = re.compile(R'\A\s+')
+
     def _get_headparts(self, head: Iterable[tuple[str, str]]):
+        mw = mimewords.convert
+        ls = self._LEADING_SPACES
+
         def normalize_spaces(value: str):
-            return ''.join(re.sub(R'\A\s+', '\x20', t) for t in value.splitlines(False))
+            return ''.join(ls.sub('\x20', t) for t in value.splitlines(False))
 
         _headers: dict[str, list[str]] = {}
         for key, value in head:
-            _headers.setdefault(key, []).append(mimewords.convert(normalize_spaces(value)))
+            _headers.setdefault(key, []).append(mw(normalize_spaces(value)))
         headers = {
             key: value[0] if len(value) == 1 else [t for t in value if t]
             for key, value in _headers.items()}
@@ -149,19 +154,22 @@ class xtmail(PathExtractorUnit):
         return chardet
 
     def _get_parts_regular(self, data: bytes):
-        for codec in ('ascii', 'utf8', ...):
-            try:
-                if codec is ...:
-                    info = self._chardet.detect(data)
-                    codec = str(info['encoding'])
-                msg = data.decode(codec)
-                break
-            except UnicodeDecodeError:
-                continue
+        if data.isascii():
+            msg = BytesParser().parsebytes(data)
         else:
-            raise ValueError('This is not a plaintext email message.')
+            for codec in ('utf8', 0x2000, None):
+                try:
+                    if not isinstance(codec, str):
+                        info = self._chardet.detect(data[:codec])
+                        codec = str(info['encoding'])
+                    text = data.decode(codec)
+                    break
+                except (UnicodeDecodeError, LookupError):
+                    continue
+            else:
+                raise ValueError('This is not a plaintext email message.')
+            msg = Parser().parsestr(text)
 
-        msg = Parser().parsestr(msg)
         yield from self._get_headparts(msg.items())
 
         for k, part in enumerate(msg.walk()):
@@ -172,7 +180,7 @@ class xtmail(PathExtractorUnit):
                 extension = file_extension(part.get_content_type(), 'txt')
                 path = F'body.{extension}'
             else:
-                path = path | mimewords | str
+                path = mimewords.convert(path)
                 path = F'attachments/{path}'
             try:
                 payload = part.get_payload(decode=True)
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import struct
+
+from bisect import bisect_left, bisect_right
 from collections import deque
-from typing import TYPE_CHECKING, Container
+from typing import TYPE_CHECKING, Iterable
 
-from refinery.lib.executable import CompartmentNotFound, Executable, Range
+from refinery.lib.executable import BO, CompartmentNotFound, Executable, Range
 from refinery.lib.tools import NoLogging
 from refinery.lib.types import Param
 from refinery.units import Arg, Unit
@@ -29,7 +32,7 @@ class vmemref(Unit):
         self,
         exe: Executable,
         function: SmdaFunction,
-        codes: Container[Range],
+        codes: Iterable[Range],
         max_dereference_depth: int,
         max_dereference_count: int,
         references: dict,
@@ -41,49 +44,68 @@ class vmemref(Unit):
                 return False
             if address in instructions:
                 return False
-            for code in codes:
-                if address in code:
-                    return False
+            if (k := bisect_right(code_starts, address) - 1) >= 0 and address < code_ends[k]:
+                return False
             return True
 
         def dereference(address):
-            return int.from_bytes(exe[address:address + pointer_size], exe.byte_order().value)
+            data = exe[address:address + pointer_size]
+            if len(data) == pointer_size:
+                return unpack(data)[0]
+            return int.from_bytes(data, byte_order.value)
 
         pointer_size = exe.pointer_size // 8
+        byte_order = exe.byte_order()
+        bo = '>' if byte_order is BO.BE else '<'
+        pf = {2: 'H', 4: 'I', 8: 'Q'}[pointer_size]
+        unpack = struct.Struct(F'{bo}{pf}').unpack
+        code_starts: list[int] = []
+        code_ends: list[int] = []
+
+        for lower, upper in sorted(codes):
+            if code_ends and lower <= code_ends[-1]:
+                code_ends[-1] = max(code_ends[-1], upper)
+            else:
+                code_starts.append(lower)
+                code_ends.append(upper)
+
+        data_refs = []
 
         with NoLogging():
-            instructions = {op.offset: op for op in function.getInstructions()}
+            operations = list(function.getInstructions())
+            for op in operations:
+                try:
+                    refs = list(op.getDataRefs())
+                except Exception:
+                    continue
+                data_refs.extend(refs)
 
-        for op in instructions.values():
+        instructions = {op.offset for op in operations}
+
+        for address in data_refs:
             try:
-                with NoLogging():
-                    refs = list(op.getDataRefs())
+                address = int(address)
             except Exception:
                 continue
-            for address in refs:
-                try:
-                    address = int(address)
-                except Exception:
+            addresses = deque([address])
+            while addresses:
+                address = addresses.pop()
+                if not is_valid_data_address(address):
+                    continue
+                if (count := references.get(address, 0)) > max_dereference_depth:
                     continue
-                addresses = deque([address])
-                while addresses:
-                    address = addresses.pop()
-                    if not is_valid_data_address(address):
-                        continue
-                    if (count := references.get(address, 0)) > max_dereference_depth:
-                        continue
-                    elif not count:
-                        yield address
-                    references[address] = count + 1
-                    for _ in range(max_dereference_count):
-                        try:
-                            point = dereference(address)
-                        except Exception:
-                            pass
-                        else:
-                            addresses.appendleft(point)
-                        finally:
-                            address += pointer_size
+                elif not count:
+                    yield address
+                references[address] = count + 1
+                for _ in range(max_dereference_count):
+                    try:
+                        point = dereference(address)
+                    except Exception:
+                        pass
+                    else:
+                        addresses.appendleft(point)
+                    finally:
+                        address += pointer_size
 
     def __init__(
         self,
@@ -152,20 +174,23 @@ class vmemref(Unit):
                 addresses = [pfn.offset for pfn in graph.getFunctions()]
                 addresses.sort()
 
+        xcfg = graph.xcfg
+        starts = sorted(xcfg)
+
         for a in addresses:
             reset()
-            address, function = min(
-                graph.xcfg.items(), key=lambda t: (abs(t[0] - a), t[0] >= a))
+            k = bisect_left(starts, a)
+            address = min(starts[max(k - 1, 0):k + 1], key=lambda t: (abs(t - a), t >= a))
+            function = xcfg[address]
             self.log_debug(F'scanning function: 0x{address:0{fmt}X}')
-            refs = list(self._memory_references(
+            refs = sorted(self._memory_references(
                 exe,
                 function,
                 avoid,
                 self.args.deref_depth,
                 self.args.deref_count,
                 visits,
-            ))
-            refs.sort(reverse=True)
+            ), reverse=True)
             last_start = None
             for ref in refs:
                 try:
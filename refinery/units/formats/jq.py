@@ -1,8 +1,11 @@
 import json
 
+from functools import cached_property
+
 import jq as _jq
 
 from refinery import Unit, Arg
+from refinery.lib.json import loads as fast_json_loads
 
 
 class jq(Unit):
@@ -26,10 +29,18 @@ class jq(Unit):
         if not data:
             return data
 
-        parsed = json.loads(data)
-        for obj in _jq.compile(self.args.filter.decode(self.codec)).input(parsed):
+        try:
+            parsed = fast_json_loads(data)
+        except json.JSONDecodeError:
+            # orjson rejects some documents that the standard library accepts, e.g. big integers
+            parsed = json.loads(data)
+        for obj in self._program.input(parsed):
             yield from self._chunk_and_format_data(obj)
 
+    @cached_property
+    def _program(self):
+        return _jq.compile(self.args.filter.decode(self.codec))
+
     def _chunk_and_format_data(self, data):
         if self.args.explode:
             if isinstance(data, list):
@@ -56,10 +67,12 @@ class jq(Unit):
             return self._format_json_dumps(data)
         return str(data).encode(self.codec)
 
+    @cached_property
+    def _encoder(self) -> json.JSONEncoder:
+        return json.JSONEncoder(
+            sort_keys=self.args.sort_keys,
+            indent=None if self.args.compact else 4,
+        )
+
     def _format_json_dumps(self, data) -> bytes:
-        kwargs = {}
-        if self.args.sort_keys:
-            kwargs["sort_keys"] = True
-        if not self.args.compact:
-            kwargs["indent"] = 4
-        return json.dumps(data, **kwargs).encode(self.codec)
+        return self._encoder.encode(data).encode(self.codec)
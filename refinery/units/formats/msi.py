@@ -7,16 +7,24 @@ import re
 import struct
 
 from functools import cached_property
-from typing import NamedTuple
+from typing import Iterable, NamedTuple
 
 from refinery.lib import chunks, json
 from refinery.lib.cab import Cabinet
 from refinery.lib.id import buffer_offset, is_likely_msi, is_likely_pe
-from refinery.lib.structures import StructReader
+from refinery.lib.structures import EOF, StructReader
 from refinery.lib.types import Param, buf
 from refinery.units import Arg
 from refinery.units.formats.office.xtdoc import UnpackResult, xtdoc
 
+_FORMATTED_REFERENCE = re.compile(R'''(?x)
+    \[             # open square bracket
+      (?![~\\])    # not followed by escapes
+      ([%$!#]?)    # any of the valid prefix characters
+      ([^[\]{}]+)  # no brackets or braces
+    \]''')
+_FORMATTED_ESCAPE = re.compile(r'\[\\(.)\]')
+
 
 class MsiType(enum.IntEnum):
     """
@@ -89,22 +97,25 @@ _NEGATED_MSI_SIGNATURE = B'\x2F\x30\xEE\x1F\x5E\x4E\xE5\x1E'
 
 class MSIStringData:
     def __init__(self, string_data: buf, string_pool: buf):
-        data = StructReader(string_data)
         pool = StructReader(string_pool)
-        self.strings: list[bytes] = []
-        self.provided_ref_count: list[int] = []
-        self.computed_ref_count: list[int] = []
+        read_string = StructReader(string_data).read_bytes
+        strings: list[bytes] = []
+        provided_ref_count: list[int] = []
         self.codepage = pool.u16()
         self._unknown = pool.u16()
-        while not pool.eof:
-            size = pool.u16()
-            rc = pool.u16()
+        entries = iter(pool.read_struct(F'{-(-pool.remaining_bytes // 4)}I'))
+        for entry in entries:
+            size = entry & 0xFFFF
+            rc = entry >> 16
             if size == 0 and rc != 0:
-                size = pool.u32()
-            string = data.read_bytes(size)
-            self.strings.append(string)
-            self.provided_ref_count.append(rc)
-            self.computed_ref_count.append(0)
+                if (size := next(entries, None)) is None:
+                    raise EOF(4)
+            strings.append(read_string(size))
+            provided_ref_count.append(rc)
+        self.strings = strings
+        self.provided_ref_count = provided_ref_count
+        self.computed_ref_count = [0] * len(strings)
+        self._decoded: list[str | None] = [None] * len(strings)
 
     @cached_property
     def codec(self):
@@ -128,11 +139,14 @@ class MSIStringData:
         index -= 1
         if increment:
             self.computed_ref_count[index] += 1
-        string = self.strings[index]
-        try:
-            return string.decode(self.codec)
-        except UnicodeDecodeError:
-            return string.decode('latin1')
+        if (decoded := self._decoded[index]) is None:
+            string = self.strings[index]
+            try:
+                decoded = string.decode(self.codec)
+            except UnicodeDecodeError:
+                decoded = string.decode('latin1')
+            self._decoded[index] = decoded
+        return decoded
 
 
 class xtmsi(xtdoc):
@@ -167,6 +181,8 @@ class xtmsi(xtdoc):
         0x36: 'VBScript text specified by a property value.',
     }
 
+    _CUSTOM_ACTION_SCRIPTS = {0x25: 'js', 0x26: 'vbs', 0x33: None}
+
     def __init__(
         self, *paths,
         list=False, path=b'path', join_path=False, drop_path=False, fuzzy=0, exact=False, regex=False,
@@ -198,13 +214,11 @@ class xtmsi(xtdoc):
         def column_formats(table: dict[str, MSITableColumnInfo]) -> str:
             return ''.join(v.struct_format for v in table.values())
 
-        def stream_to_rows(data: buf, row_format: str):
+        def stream_to_rows(data: buf, row_format: str) -> Iterable[tuple[int, ...]]:
             row_size = struct.calcsize(F'<{row_format}')
-            row_count = int(len(data) / row_size)
+            row_count = len(data) // row_size
             reader = StructReader(data)
-            columns = [reader.read_struct(F'<{sc * row_count}') for sc in row_format]
-            for i in range(row_count):
-                yield [int(c[i]) for c in columns]
+            return zip(*(reader.read_struct(F'<{row_count}{sc}') for sc in row_format))
 
         tables: dict[str, dict[str, MSITableColumnInfo]] = collections.defaultdict(collections.OrderedDict)
         strings = MSIStringData(stream('!_StringData'), stream('!_StringPool'))
@@ -252,15 +266,10 @@ class xtmsi(xtdoc):
                 return tbl.get(name, '')
             while True:
                 _replace_done = True
-                string = re.sub(R'''(?x)
-                    \[             # open square bracket
-                      (?![~\\])    # not followed by escapes
-                      ([%$!#]?)    # any of the valid prefix characters
-                      ([^[\]{}]+)  # no brackets or braces
-                    \]''', _replace, string)
+                string = _FORMATTED_REFERENCE.sub(_replace, string)
                 if _replace_done:
                     break
-            string = re.sub(r'\[\\(.)\]', r'\1', string)
+            string = _FORMATTED_ESCAPE.sub(r'\1', string)
             string = string.replace('[~]', '\0')
             return string
 
@@ -274,6 +283,8 @@ class xtmsi(xtdoc):
             temp = [k.strip('_') for k in keys]
             if len(set(keys)) == len(set(temp)):
                 keys = temp
+            keys = tuple(keys)
+            einfo = dict(zip(keys, info))
             for r, row in enumerate(stream_to_rows(stream(stream_name), column_formats(table))):
                 values = []
                 for index, value in enumerate(row):
@@ -296,7 +307,6 @@ class xtmsi(xtdoc):
                 if table_name == 'Component':
                     tbl_properties[values[0]] = F'%{values[2]}%'
                 entry = dict(zip(keys, values))
-                einfo = {t: i for t, i in zip(keys, info)}
                 if table_name == 'MsiFileHash':
                     entry['Hash'] = struct.pack(
                         '<IIII',
@@ -312,7 +322,7 @@ class xtmsi(xtdoc):
                     except LookupError:
                         pass
                     t = einfo.get('Target')
-                    c = {0x25: 'js', 0x26: 'vbs', 0x33: None}
+                    c = self._CUSTOM_ACTION_SCRIPTS
                     if code in c and t and not t.is_integer:
                         postprocessing.append(ScriptItem(r, c[code]))
                 processed.append(entry)
@@ -2,20 +2,20 @@ from __future__ import annotations
 
 import codecs
 import itertools
-import json
 
 from contextlib import suppress
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from enum import Enum
+from functools import lru_cache
+from typing import Any, Callable
 
-from refinery.lib import lief
-from refinery.lib.dotnet.header import DotNetHeader
+from refinery.lib import json, lief
 from refinery.lib.dt import date_from_timestamp
 from refinery.lib.id import is_likely_pe
 from refinery.lib.lcid import LCID
 from refinery.lib.resources import datapath
-from refinery.lib.tools import proxy, unwrap
+from refinery.lib.tools import NoLogging, proxy, unwrap
 from refinery.lib.types import Param
 from refinery.units import Arg
 from refinery.units.formats import JSONTableUnit
@@ -27,14 +27,19 @@ def _FILETIME(value: int) -> datetime:
     return datetime.fromtimestamp(s, timezone.utc).replace(microsecond=(ns100 // 10))
 
 
+@lru_cache(maxsize=None)
+def _address_formatter(width: int) -> Callable[[int], str]:
+    return F'0x{{:0{width}X}}'.format
+
+
 def _STRING(value: str | bytes, dll: bool = False) -> str:
     if not isinstance(value, str):
         if not isinstance(value, bytes):
             value = bytes(value)
         value, _, _ = value.partition(B'\0')
         value = value.decode('utf8')
-    if dll and value.lower().endswith('.dll'):
-        value = value[~3:]
+    if dll and value[-4:].lower() == '.dll':
+        value = value[:-4]
     return value
 
 
@@ -75,8 +80,10 @@ class VersionInfo:
         return not self.err
 
 
-with datapath('rich.json').open('r') as stream:
-    RICH = json.load(stream)
+RICH = json.loads(datapath('rich.json').read_bytes())
+
+_RICH_VER: dict[int, dict[str, str]] = {int(k, 16): v for k, v in RICH['ver'].items()}
+_RICH_PID: dict[int, str] = {int(k, 16): v for k, v in RICH['pid'].items()}
 
 
 class ShortPID(str, Enum):
@@ -98,46 +105,38 @@ class ShortPID(str, Enum):
         return F'{self.value:>{width}}'
 
 
+_SHORT_PIDS = {
+    'UTC': ShortPID.UTC,
+    'CVTRES': ShortPID.RES,
+    'CVTOMF': ShortPID.OMF,
+    'CVTPGD': ShortPID.PGD,
+    'LINKER': ShortPID.LNK,
+    'EXPORT': ShortPID.EXP,
+    'IMPORT': ShortPID.IMP,
+    'IMPLIB': ShortPID.IMP,
+    'ALIASOBJ': ShortPID.OBJ,
+    'RESOURCE': ShortPID.RES,
+    'PHX': ShortPID.PHX,
+    'PHOENIX': ShortPID.PHX,
+    'MASM': ShortPID.ASM,
+    'ILASM': ShortPID.MIL,
+    'VISUALBASIC': ShortPID.VB6,
+}
+
+_SHORT_PID_LENGTHS = sorted({len(prefix) for prefix in _SHORT_PIDS})
+
+
 def get_rich_short_pid(pid: str) -> ShortPID:
     pid = pid.upper()
-    if pid.startswith('UTC'):
-        return ShortPID.UTC
-    if pid.startswith('CVTRES'):
-        return ShortPID.RES
-    if pid.startswith('CVTOMF'):
-        return ShortPID.OMF
-    if pid.startswith('CVTPGD'):
-        return ShortPID.PGD
-    if pid.startswith('LINKER'):
-        return ShortPID.LNK
-    if pid.startswith('EXPORT'):
-        return ShortPID.EXP
-    if pid.startswith('IMPORT'):
-        return ShortPID.IMP
-    if pid.startswith('IMPLIB'):
-        return ShortPID.IMP
-    if pid.startswith('ALIASOBJ'):
-        return ShortPID.OBJ
-    if pid.startswith('RESOURCE'):
-        return ShortPID.RES
-    if pid.startswith('PHX'):
-        return ShortPID.PHX
-    if pid.startswith('PHOENIX'):
-        return ShortPID.PHX
-    if pid.startswith('MASM'):
-        return ShortPID.ASM
-    if pid.startswith('ILASM'):
-        return ShortPID.MIL
-    if pid.startswith('VISUALBASIC'):
-        return ShortPID.VB6
+    for length in _SHORT_PID_LENGTHS:
+        if (short_pid := _SHORT_PIDS.get(pid[:length])) is not None:
+            return short_pid
     raise LookupError(pid)
 
 
 def get_rich_info(vid: int) -> VersionInfo:
-    pid = vid >> 0x10
-    ver = vid & 0xFFFF
-    ver = RICH['ver'].get(F'{ver:04X}')
-    pid = RICH['pid'].get(F'{pid:04X}')
+    ver = _RICH_VER.get(vid & 0xFFFF)
+    pid = _RICH_PID.get(vid >> 0x10)
     err = ver is None and pid is None
     if ver is not None:
         suffix = ver.get('ver')
@@ -193,23 +192,12 @@ class pemeta(JSONTableUnit):
             timeraw=timeraw,
             tabular=tabular,
         )
+        self._address_width: tuple[lief.PE.Binary, int, int] | None = None
 
     @classmethod
     def handles(cls, data):
         return is_likely_pe(data)
 
-    @classmethod
-    def _ensure_string(cls, x):
-        if not isinstance(x, str):
-            x = repr(x) if not isinstance(x, bytes) else x.decode(cls.codec, 'backslashreplace')
-        return x
-
-    @classmethod
-    def _parse_pedict(cls, bin: dict):
-        return {
-            cls._ensure_string(key).replace(" ", ""): cls._ensure_string(val)
-            for key, val in bin.items() if val}
-
     @classmethod
     def parse_signature(cls, data: bytes | bytearray | memoryview) -> dict:
         """
@@ -235,25 +223,30 @@ class pemeta(JSONTableUnit):
                 raise LookupError
             return value[0]
 
-        def find_timestamps(entry) -> dict | None:
-            if isinstance(entry, dict):
-                try:
-                    return {'Timestamp': _value(entry, 'signingTime')}
-                except LookupError:
-                    pass
-                for value in entry.values():
-                    result = find_timestamps(value)
-                    if result is None:
-                        continue
-                    with suppress(KeyError):
-                        result.setdefault('TimestampIssuer', entry['sid']['issuer']['commonName'])
-                    return result
-            elif isinstance(entry, list):
-                for value in entry:
-                    result = find_timestamps(value)
-                    if result is None:
-                        continue
-                    return result
+        def find_timestamps(root) -> dict | None:
+            stack: list[tuple[Any, tuple | None]] = [(root, None)]
+            while stack:
+                entry, parents = stack.pop()
+                if isinstance(entry, dict):
+                    if entry.get('type') == 'signingTime':
+                        try:
+                            result = {'Timestamp': _value(entry)}
+                        except LookupError:
+                            pass
+                        else:
+                            while parents is not None:
+                                parent, parents = parents
+                                with suppress(KeyError):
+                                    result.setdefault(
+                                        'TimestampIssuer', parent['sid']['issuer']['commonName'])
+                            return result
+                    children = entry.values()
+                    parents = entry, parents
+                elif isinstance(entry, list):
+                    children = entry
+                else:
+                    continue
+                stack.extend((child, parents) for child in reversed(children))
 
         timestamp_info = find_timestamps(signature)
         if timestamp_info is not None:
@@ -339,34 +332,29 @@ class pemeta(JSONTableUnit):
             info['Signer'] = signer_certificates
         return info
 
-    def _pe_characteristics(self, pe: lief.PE.Binary):
-        characteristics = {F'IMAGE_FILE_{flag.name}' for flag in lief.PE.Header.CHARACTERISTICS
-            if pe.header.characteristics & flag.value}
-        if pe.header.characteristics & 0x40:
-            # TODO: Missing from LIEF
-            characteristics.add('IMAGE_FILE_16BIT_MACHINE')
-        return characteristics
-
     def _pe_address_width(self, pe: lief.PE.Binary, default=16) -> int:
+        pe = unwrap(pe)
+        if (cached := self._address_width) and cached[0] is pe and cached[1] == default:
+            return cached[2]
+        header = pe.header
+        MT = lief.PE.Header.MACHINE_TYPES
         # TODO: missing from LIEF
         IMAGE_FILE_16BIT_MACHINE = 0x40
-        if pe.header.characteristics & IMAGE_FILE_16BIT_MACHINE:
-            return 4
-        elif pe.header.machine == lief.PE.Header.MACHINE_TYPES.I386:
-            return 8
-        elif pe.header.machine in (
-            lief.PE.Header.MACHINE_TYPES.AMD64,
-            lief.PE.Header.MACHINE_TYPES.IA64,
-        ):
-            return 16
+        if header.characteristics & IMAGE_FILE_16BIT_MACHINE:
+            width = 4
+        elif (machine := header.machine) == MT.I386:
+            width = 8
+        elif machine == MT.AMD64 or machine == MT.IA64:
+            width = 16
         else:
-            return default
+            width = default
+        self._address_width = pe, default, width
+        return width
 
     def _vint(self, pe: lief.PE.Binary, value: int):
         if not self.args.tabular:
             return value
-        aw = self._pe_address_width(pe)
-        return F'0x{value:0{aw}X}'
+        return _address_formatter(self._pe_address_width(pe))(value)
 
     def parse_version(self, pe: lief.PE.Binary, data=None) -> dict | None:
         """
@@ -381,10 +369,8 @@ class pemeta(JSONTableUnit):
 
         if info := version.string_file_info:
             for child in info.children:
-                entries = {e.key: e.value for e in child.entries}
-                version_info.update({
-                    k.replace(' ', ''): _STRING(v) for k, v in entries.items()
-                })
+                for entry in child.entries:
+                    version_info[entry.key.replace(' ', '')] = _STRING(entry.value)
 
         if rsrc.has_icons:
             icon = next(iter(rsrc.icons))
@@ -451,43 +437,43 @@ class pemeta(JSONTableUnit):
         info = []
         if not pe.has_exports:
             return None
-        for k, exp in enumerate(pe.get_export().entries):
-            name = exp.demangled_name
-            if not name:
-                name = exp.name
-            if not name:
-                name = F'@{k}'
-            if not isinstance(name, str):
-                name = codecs.decode(name, 'latin1')
-            item = {
-                'Name': name, 'Address': self._vint(pe, exp.address + base)
-            } if include_addresses else name
-            info.append(item)
+        pe = unwrap(pe)
+        with NoLogging(NoLogging.Mode.ALL):
+            for k, exp in enumerate(pe.get_export().entries):
+                name = exp.demangled_name
+                if not name:
+                    name = exp.name
+                if not name:
+                    name = F'@{k}'
+                if not isinstance(name, str):
+                    name = codecs.decode(name, 'latin1')
+                item = {
+                    'Name': name, 'Address': self._vint(pe, exp.address + base)
+                } if include_addresses else name
+                info.append(item)
         return info
 
     def parse_imports(self, pe: lief.PE.Binary, data=None, include_addresses=False):
         info = {}
-        for idd in itertools.chain(pe.imports, pe.delay_imports):
-            dll = _STRING(idd.name)
-            if dll.lower().endswith('.dll'):
-                dll = dll[:~3]
-            imports: list[dict | str] = info.setdefault(dll, [])
-            for imp in idd.entries:
-                name = _STRING(imp.name) or F'@{imp.ordinal}'
-                imports.append(dict(
-                    Name=name, Address=self._vint(pe, imp.value)
-                ) if include_addresses else name)
+        pe = unwrap(pe)
+        with NoLogging(NoLogging.Mode.ALL):
+            for idd in itertools.chain(pe.imports, pe.delay_imports):
+                dll = _STRING(idd.name, True)
+                imports: list[dict | str] = info.setdefault(dll, [])
+                for imp in idd.entries:
+                    name = _STRING(imp.name) or F'@{imp.ordinal}'
+                    imports.append(dict(
+                        Name=name, Address=self._vint(pe, imp.value)
+                    ) if include_addresses else name)
         return info
 
     def parse_header(self, pe: lief.PE.Binary, data=None) -> dict:
         major = pe.optional_header.major_operating_system_version
         minor = pe.optional_header.minor_operating_system_version
-        version = self._WINVER.get(major, {0: 'Unknown'})
-
-        try:
-            MinimumOS = version[minor]
-        except LookupError:
-            MinimumOS = version[0]
+        if version := self._WINVER.get(major):
+            MinimumOS = version.get(minor, version[0])
+        else:
+            MinimumOS = 'Unknown'
         header_information: dict[str, int | str | list] = {
             'Machine': pe.header.machine.name,
             'Subsystem': pe.optional_header.subsystem.name,
@@ -501,11 +487,12 @@ class pemeta(JSONTableUnit):
         if pe.has_rich_header:
             rich = []
             cw = None
+            entries = [
+                (entry.build_id | (entry.id << 0x10), entry.count)
+                for entry in unwrap(pe).rich_header.entries]
             if self.args.tabular:
-                cw = max(len(F'{entry.count:d}') for entry in pe.rich_header.entries)
-            for entry in pe.rich_header.entries:
-                idv = entry.build_id | (entry.id << 0x10)
-                count = entry.count
+                cw = len(str(max((count for _, count in entries), default=0)))
+            for idv, count in entries:
                 info = get_rich_info(idv)
                 if not info:
                     continue
@@ -522,13 +509,9 @@ class pemeta(JSONTableUnit):
                     })
             header_information['RICH'] = rich
 
-        characteristics = self._pe_characteristics(pe)
-        for typespec, flag in {
-            'EXE': 'IMAGE_FILE_EXECUTABLE_IMAGE',
-            'DLL': 'IMAGE_FILE_DLL',
-            'SYS': 'IMAGE_FILE_SYSTEM'
-        }.items():
-            if flag in characteristics:
+        characteristics = unwrap(pe).header.characteristics
+        for typespec, flag in self._TYPE_FLAGS:
+            if characteristics & flag:
                 header_information['Type'] = typespec
 
         base = pe.optional_header.imagebase
@@ -552,18 +535,20 @@ class pemeta(JSONTableUnit):
             info.update(Linker=dt(pe.header.time_date_stamps))
 
         import_timestamps = {}
-        for entry in pe.imports:
-            ts = entry.timedatestamp
-            if ts == 0 or ts == 0xFFFFFFFF:
-                continue
-            import_timestamps[_STRING(entry.name, True)] = dt(ts)
-
         symbol_timestamps = {}
-        for entry in pe.delay_imports:
-            ts = entry.timestamp
-            if ts == 0 or ts == 0xFFFFFFFF:
-                continue
-            symbol_timestamps[_STRING(entry.name, True)] = dt(ts)
+
+        with NoLogging(NoLogging.Mode.ALL):
+            binary = unwrap(pe)
+            for entry in binary.imports:
+                ts = entry.timedatestamp
+                if ts == 0 or ts == 0xFFFFFFFF:
+                    continue
+                import_timestamps[_STRING(entry.name, True)] = dt(ts)
+            for entry in binary.delay_imports:
+                ts = entry.timestamp
+                if ts == 0 or ts == 0xFFFFFFFF:
+                    continue
+                symbol_timestamps[_STRING(entry.name, True)] = dt(ts)
 
         for key, impts in [
             ('Import', import_timestamps),
@@ -609,6 +594,7 @@ class pemeta(JSONTableUnit):
         Extracts a JSON-serializable and human-readable dictionary with information about
         the .NET metadata of an input PE file.
         """
+        from refinery.lib.dotnet.header import DotNetHeader
         header = DotNetHeader(data, pe)
         tables = header.meta.Streams.Tables
         info: dict[str, str | int | list[str]] = dict(
@@ -744,6 +730,12 @@ class pemeta(JSONTableUnit):
 
         return result
 
+    _TYPE_FLAGS = (
+        ('EXE', 0x0002), # IMAGE_FILE_EXECUTABLE_IMAGE
+        ('DLL', 0x2000), # IMAGE_FILE_DLL
+        ('SYS', 0x1000), # IMAGE_FILE_SYSTEM
+    )
+
     _CHARSET = {
         0x0000: '7-bit ASCII',
         0x03A4: 'Japan (Shift ? JIS X-0208)',
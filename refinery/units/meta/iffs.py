@@ -23,9 +23,6 @@ class iffs(ConditionalUnit, docs='{0}{p}{1}'):
     def match(self, chunk):
         needle = self.args.needle
         if self.args.nocase:
-            from re import IGNORECASE, escape, search
-            return search(
-                escape(needle), chunk, flags=IGNORECASE
-            ) is not None
+            return needle.lower() in chunk.lower()
         else:
             return needle in chunk
@@ -3,7 +3,9 @@ from __future__ import annotations
 import enum
 
 from collections import Counter
+from functools import lru_cache
 from itertools import product
+from operator import itemgetter
 from typing import Generator, NamedTuple
 
 from Cryptodome.Util.strxor import strxor
@@ -11,6 +13,9 @@ from Cryptodome.Util.strxor import strxor
 from refinery.lib.types import Param, buf
 from refinery.units import Arg, Unit
 
+_second = itemgetter(1)
+_ALL_BYTES = frozenset(range(0x100))
+
 
 def _generate_cribs(cribs: bytes | tuple[bytes | tuple[bytes, ...], ...]) -> Generator[bytes]:
     if isinstance(cribs, tuple):
@@ -39,6 +44,16 @@ def _cyclic_base(data: bytes, min_repeat: int = 2):
     return data[:length]
 
 
+@lru_cache(maxsize=None)
+def _key_candidates(alphabet: bytes, xor: bool) -> tuple[frozenset[int], ...]:
+    """
+    For each possible ciphertext byte, the set of key bytes that map it into the given alphabet.
+    """
+    if xor:
+        return tuple(frozenset(c ^ p for p in alphabet) for c in range(0x100))
+    return tuple(frozenset(c - p & 0xFF for p in alphabet) for c in range(0x100))
+
+
 def _S(options: bytes):
     return tuple(bytes((b,)) for b in options)
 
@@ -277,6 +292,39 @@ class xkey(Unit):
 
         yield from freq
 
+    @Unit.Requires('numpy', ['speed', 'default', 'extended'])
+    def _numpy():
+        import numpy
+        return numpy
+
+    def _column_statistics(self, view: memoryview, patches: list[memoryview]):
+        """
+        For each of the given patches, compute the number of distinct byte values and the most
+        common byte value together with its count. Ties are broken in favor of the byte value
+        that occurs first in the patch.
+        """
+        keylen = len(patches)
+        try:
+            np = self._numpy
+            data = np.frombuffer(view, dtype=np.uint8)
+        except ImportError:
+            histograms = [Counter(p) for p in patches]
+            return [len(h) for h in histograms], [max(h.items(), key=_second) for h in histograms]
+        index = np.arange(len(data)) % keylen
+        index <<= 8
+        index |= data
+        counts = np.bincount(index, minlength=keylen << 8).reshape(keylen, 0x100)
+        best = counts.max(axis=1)
+        value = counts.argmax(axis=1)
+        for j in np.flatnonzero(np.count_nonzero(counts == best[:, None], axis=1) > 1):
+            if not best[j]:
+                continue
+            column = data[j::keylen]
+            tied = np.flatnonzero(counts[j] == best[j])
+            value[j] = column[np.isin(column, tied).argmax()]
+        distinct = np.count_nonzero(counts, axis=1).tolist()
+        return distinct, list(zip(value.tolist(), best.tolist()))
+
     def _process_crib(
         self,
         view: memoryview,
@@ -304,41 +352,41 @@ class xkey(Unit):
         bounds: tuple[int, int, int],
         alphabets: dict[int, list[bytes]] | None,
         xor: bool,
-        hist: dict[int, tuple[list[bytes], list[Counter]]],
+        hist: dict[int, tuple[list[memoryview], list[int], list[tuple[int, int]]]],
     ):
         n = len(view)
         start, stop, step = bounds
         score = 0
         guess = None
-        first = not hist
+        scoring = self.args.freq and not hist
 
         for keylen in range(start, stop + 1, step):
+            # The scaling factor applied below bounds the score from above and decreases with the
+            # key length; once it drops below the best score, no longer key can improve on it.
+            hopeless = not scoring or score >= ((n - keylen) / (n - 1)) ** keylen
+            if hopeless and alphabets is None:
+                break
             try:
                 cached = hist[keylen]
             except KeyError:
                 patches = [view[j::keylen] for j in range(keylen)]
-                histograms = [Counter(p) for p in patches]
-                hist[keylen] = patches, histograms
-            else:
-                patches, histograms = cached
+                hist[keylen] = cached = (patches, *self._column_statistics(view, patches))
+            patches, distinct, most_common = cached
 
             if alphabets is not None:
-                hlc = Counter(len(h) for h in histograms)
-                base, coverage = hlc.most_common(1)[0]
+                hlc = Counter(distinct)
+                base, coverage = max(hlc.items(), key=_second)
 
                 if coverage * 2 > keylen and base in alphabets:
                     self.log_debug(F'solving for potential plaintext alphabet of size 0x{base:02X} at {keylen}')
                     keys: dict[bytes, bytes] = {}
                     for alphabet in alphabets[base]:
+                        candidates = _key_candidates(alphabet, xor)
                         key = bytearray(keylen)
                         for k, patch in enumerate(patches):
-                            keybyte = set(range(0x100))
-                            for c in patch:
-                                keybyte &= (
-                                    {c ^ p & 0xFF for p in alphabet}
-                                ) if xor else (
-                                    {c - p & 0xFF for p in alphabet}
-                                )
+                            keybyte = _ALL_BYTES
+                            for c in dict.fromkeys(patch):
+                                keybyte &= candidates[c]
                                 if len(keybyte) == 1:
                                     key[k] = next(iter(keybyte))
                                     break
@@ -352,10 +400,10 @@ class xkey(Unit):
                         alphabet, key = keys.popitem()
                         return self._result(bytes(key), self._rt.alph, xor)
 
-            if not first or not self.args.freq:
+            if hopeless:
                 continue
 
-            _guess = [h.most_common(1)[0] for h in histograms]
+            _guess = most_common
             _score = sum(letter_count for _, letter_count in _guess) / n
             # This scaling accounts for the smaller probability of larger keys. No proper statistical analysis has been
             # conducted to derive it; there might be plenty of room for improvement here.
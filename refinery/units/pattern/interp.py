@@ -1,10 +1,9 @@
-import re
-import re
+from __future__ import annotations
+
 import struct
-from abc import ABC
-from typing import ByteString, Union, Optional, Generator, Tuple
 
-from refinery import Unit, Arg
+from refinery.lib.types import Param
+from refinery.units import Arg, Unit
 
 
 class interp(Unit):
@@ -13,47 +12,88 @@ class interp(Unit):
     The interpreted data is then formatted as a string.
     """
 
-    class formatPart(ABC):
-        def __init__(self, s: str):
-            self._s = s
-
-        def eat(self, data: memoryview) -> Tuple[bytes, memoryview]:
-            pass
-
-        def __repr__(self) -> str:
-            return f"{self.__class__.__name__}({repr(self._s)})"
+    def __init__(self,
+                 format: Param[str, Arg(type=str, help='format string for interpretation')],
+                 as_chunks: Param[bool, Arg.Switch('-c')] = False):
+        super().__init__(format=format, as_chunks=as_chunks)
+        parts: list[str | struct.Struct] = []
+        segments = self.args.format.split('{')
+        pre = segments[0]
+        for segment in segments[1:]:
+            end = segment.rfind('}')
+            if end <= 0:
+                pre = segment
+                continue
+            if pre:
+                parts.append(pre)
+            parts.append(struct.Struct(segment[:end]))
+            if post := segment[end + 1:]:
+                parts.append(post)
+            pre = ''
+        self._fused = self._fuse(parts)
+        self._plan = [
+            p.encode(self.codec) if isinstance(p, str) else (p, self._placeholder(p))
+            for p in parts
+        ]
 
-    class formatPartSeparator(formatPart):
-        def eat(self, data: memoryview) -> Tuple[bytes, memoryview]:
-            return self._s.encode(Unit.codec), data
+    @staticmethod
+    def _placeholder(field: struct.Struct) -> bytes:
+        """
+        Integers are rendered with %d. Every other value struct can produce is a float, bool, or
+        bytes object, for which the %r conversion of a bytes template coincides with str.
+        """
+        value = field.unpack(bytes(field.size))
+        return B'%d' if len(value) == 1 and type(value[0]) is int else B'%r'
 
-    class formatPartStruct(formatPart):
-        def eat(self, data: memoryview) -> Tuple[bytes, memoryview]:
-            size = struct.calcsize(self._s)
-            value, = struct.unpack(self._s, data[:size])
-            return str(value).encode(Unit.codec), data[size:]
+    def _fuse(self, parts: list[str | struct.Struct]):
+        """
+        If all struct parts use the same byte order with standard sizes and each of them yields
+        a single value, they can be read by one combined struct without alignment padding. In
+        that case, return the combined struct and a template to format the unpacked values.
+        """
+        fields = [p for p in parts if isinstance(p, struct.Struct)]
+        if not fields:
+            return None
+        order = fields[0].format[:1]
+        if order not in '<>!=':
+            return None
+        for field in fields:
+            if field.format[:1] != order or len(field.unpack(bytes(field.size))) != 1:
+                return None
+        fused = struct.Struct(order + ''.join(field.format[1:] for field in fields))
+        template = B''.join(
+            self._placeholder(p) if isinstance(p, struct.Struct) else
+            p.encode(self.codec).replace(B'%', B'%%') for p in parts)
+        return fused, template
 
-    def __init__(self,
-                 format: Arg(type=str, help="format string for interpretation"),
-                 as_chunks: Arg.Switch('-c') = False):
-        super().__init__(format=format, as_chunks=as_chunks)
-        rex = re.compile(r"(?P<pre>[^{]*)\{(?P<format>[^{]+)}(?P<post>[^{]*)")
-        self.format_parts = []
-        for match in rex.finditer(self.args.format):
-            if g := match.group('pre'):
-                self.format_parts.append(self.formatPartSeparator(g))
-            if g := match.group('format'):
-                self.format_parts.append(self.formatPartStruct(g))
-            if g := match.group('post'):
-                self.format_parts.append(self.formatPartSeparator(g))
-
-    def process(self, data: ByteString) -> Union[Optional[ByteString], Generator[ByteString, None, None]]:
-        data = memoryview(data)
+    def process(self, data: bytearray):
+        view = memoryview(data)
+        end = len(view)
+        if self._fused is not None and not self.args.as_chunks:
+            fused, template = self._fused
+            tail = end % fused.size
+            out = bytearray().join(map(template.__mod__, fused.iter_unpack(view[:end - tail])))
+            if tail:
+                # a truncated record fails exactly like it does in the loop below
+                fused.unpack_from(view, end - tail)
+            yield out
+            return
+        offset = 0
         out = bytearray()
-        while data:
-            for part in self.format_parts:
-                tmp, data = part.eat(data)
-                out += tmp
+        while offset < end:
+            if self._fused is not None:
+                fused, template = self._fused
+                out.extend(template % fused.unpack_from(view, offset))
+                offset += fused.size
+            else:
+                for part in self._plan:
+                    if isinstance(part, bytes):
+                        out.extend(part)
+                        continue
+                    field, placeholder = part
+                    value, = field.unpack_from(view, offset)
+                    offset += field.size
+                    out.extend(placeholder % value)
 
             if self.args.as_chunks:
                 yield out
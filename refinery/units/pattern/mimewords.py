@@ -8,6 +8,8 @@ from email.header import decode_header
 from refinery.lib.decorators import unicoded
 from refinery.units import Unit
 
+_ENCODED_WORD = re.compile(R"=(?:\?[^\?]*){3}\?=")
+
 
 class mimewords(Unit):
     """
@@ -18,13 +20,16 @@ class mimewords(Unit):
         """
         Converts the MIME word.
         """
+        if '=?' not in word:
+            return word
+
         def replacer(match):
             decoded, = decode_header(match[0])
             raw, codec = decoded
             if not isinstance(codec, str):
                 codec = cls.codec
             return codecs.decode(raw, codec, errors='surrogateescape')
-        return re.sub(R"=(?:\?[^\?]*){3}\?=", replacer, word)
+        return _ENCODED_WORD.sub(replacer, word)
 
     @unicoded
     def process(self, data):
@@ -21,4 +21,4 @@ class ampl(Unit):
 
         sig = np.frombuffer(data, dtype=np.complex64)
         a = np.abs(sig)
-        return self.labelled(a.tobytes(), signal_type="amplitude")
+        return self.labelled(a.data, signal_type="amplitude")
@@ -32,4 +32,4 @@ class decimate(Unit):
         sig = np.frombuffer(data, dtype=np.complex64)
         sig = scipy.signal.decimate(sig, self.args.factor, ftype='fir')
 
-        return self.labelled(sig.tobytes(), sample_rate=new_sample_rate)
+        return self.labelled(sig.data, sample_rate=new_sample_rate)
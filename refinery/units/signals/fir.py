@@ -20,6 +20,8 @@ class fir(Unit):
             lower, upper = band.split("/")
             new_bands.append((float(lower), float(upper)))
         self.args.bands = new_bands
+        self._kernels = {}
+        self._mixers = {}
 
     @Unit.Requires('numpy', 'default', 'extended')
     def _numpy():
@@ -36,24 +38,36 @@ class fir(Unit):
         scipy = self._scipy
 
         meta = metavars(data)
+        sample_rate = meta["sample_rate"]
+        center_freq = meta.get("center_freq") or 0
 
         sig = np.frombuffer(data, dtype=np.complex64)
+        shifted = np.empty_like(sig)
+        mixers, self._mixers = self._mixers, {}
 
         for lower, upper in self.args.bands:
-            if center_freq := meta.get("center_freq"):
-                lower -= center_freq
-                upper -= center_freq
+            lower -= center_freq
+            upper -= center_freq
 
             half_width = (upper - lower) / 2
             shift_freq = lower + half_width
 
             # Based on https://dsp.stackexchange.com/questions/41361/how-to-implement-bandpass-filter-on-complex-valued-signal
-            kernel = scipy.signal.firwin(self.args.taps,
-                                         half_width,
-                                         scale=True,
-                                         pass_zero='lowpass',
-                                         fs=meta["sample_rate"]).astype(np.complex64)
+            key = half_width, sample_rate
+            if (kernel := self._kernels.get(key)) is None:
+                self._kernels[key] = kernel = scipy.signal.firwin(self.args.taps,
+                                                                  half_width,
+                                                                  scale=True,
+                                                                  pass_zero='lowpass',
+                                                                  fs=sample_rate).astype(np.float32)
 
-            shifted = sig * gen.generate_signal(-shift_freq, meta["sample_rate"], len(sig))
+            key = -shift_freq, sample_rate, len(sig)
+            if (mixer := mixers.get(key)) is None:
+                mixer = gen.generate_signal(*key)
+            self._mixers[key] = mixer
+            np.multiply(sig, mixer, out=shifted)
 
-            yield self.labelled(np.convolve(shifted, kernel, mode='valid'), center_freq=meta.get("center_freq", 0)+shift_freq)
+            # Overlap-add convolution is much faster than direct convolution for long signals and
+            # the comparatively short filter kernels used here.
+            filtered = scipy.signal.oaconvolve(shifted, kernel, mode='valid')
+            yield self.labelled(filtered, center_freq=center_freq+shift_freq)
@@ -20,5 +20,7 @@ class freq(Unit):
         np = self._numpy
 
         sig = np.frombuffer(data, dtype=np.complex64)
-        f = np.diff(np.unwrap(np.angle(sig)))
-        return self.labelled(f.tobytes(), signal_type="frequency")
+        f = np.conj(sig[:-1])
+        f *= sig[1:]
+        f = np.angle(f)
+        return self.labelled(f.data, signal_type="frequency")
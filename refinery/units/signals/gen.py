@@ -28,10 +28,15 @@ class gen(Unit):
     def generate_signal(self, f: float, sample_rate: float, sample_count: int):
         np = self._numpy
 
-        ampl = 1.
-        t = np.linspace(0, sample_count * (1/sample_rate), sample_count, dtype=np.complex64)
-        return ampl*np.exp(2j * np.pi * f * t)
+        step = sample_count / sample_rate / (sample_count - 1) if sample_count > 1 else 0.
+        phase = np.arange(sample_count, dtype=np.float64)
+        phase *= 2 * np.pi * f * step
+        np.mod(phase, 2 * np.pi, out=phase)
+        sig = np.empty(sample_count, dtype=np.complex64)
+        np.cos(phase, out=sig.real)
+        np.sin(phase, out=sig.imag)
+        return sig
 
     def process(self, data: ByteString) -> Union[Optional[ByteString], Generator[ByteString, None, None]]:
         sig = self.generate_signal(self.args.frequency, self.args.sample_rate, self.args.sample_count)
-        return self.labelled(sig.tobytes(), sample_rate=self.args.sample_rate)
+        return self.labelled(sig.data, sample_rate=self.args.sample_rate)
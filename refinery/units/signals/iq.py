@@ -50,4 +50,4 @@ class iq(Unit):
         sig = self._read_data(data)
         sig = self._to_complex64(sig)
 
-        return sig.tobytes()
+        return sig.data
@@ -13,6 +13,7 @@ class mix(Unit):
 
     def __init__(self, frequency: Arg.Number(help="frequency to mix with")):
         super().__init__(frequency=frequency)
+        self._mixer = None
 
     @Unit.Requires('numpy', 'default', 'extended')
     def _numpy():
@@ -25,6 +26,9 @@ class mix(Unit):
         sig = np.frombuffer(data, dtype=np.complex64)
 
         meta = metavars(data)
-        generated = gen.generate_signal(self.args.frequency, meta["sample_rate"], len(sig))
+        key = self.args.frequency, meta["sample_rate"], len(sig)
+        if self._mixer is None or self._mixer[0] != key:
+            self._mixer = key, gen.generate_signal(*key)
+        _, generated = self._mixer
 
-        return self.labelled((sig * generated).tobytes(), center_freq=meta.get("center_freq", 0)-self.args.frequency)
+        return self.labelled((sig * generated).data, center_freq=meta.get("center_freq", 0)-self.args.frequency)
@@ -32,11 +32,26 @@ class ook(Unit):
         if self.args.slice:
             sig = sig[self.args.slice]
 
-        data = np.zeros(len(sig), dtype=bytes)
-        data[np.where(sig < self.args.thresholds[0])] = self.args.codewords[0]
-        for i in range(len(self.args.thresholds)-1):
-            lower, upper = self.args.thresholds[i], self.args.thresholds[i+1]
-            data[np.where(np.logical_and(lower < sig, sig < upper))] = self.args.codewords[i+1]
-        data[np.where(self.args.thresholds[-1] < sig)] = self.args.codewords[-1]
-
-        return data.tobytes()
+        thresholds = np.asarray(self.args.thresholds, dtype=np.float32)
+        if np.any(thresholds[1:] < thresholds[:-1]):
+            raise ValueError("thresholds must be given in ascending order")
+        if len(self.args.codewords) < len(thresholds):
+            raise ValueError("at least one codeword per threshold is required")
+
+        # Each state is emitted as the first byte of its codeword. Samples that are equal to a
+        # threshold or not a number fall into no state and are decoded as a zero byte.
+        k = len(thresholds)
+        states = [cw[0] if cw else 0 for cw in (*self.args.codewords[:k], self.args.codewords[-1])]
+
+        out = np.full(len(sig), states[0], dtype=np.uint8)
+        undecided = np.isnan(sig)
+        for threshold, lower, upper in zip(thresholds, states, states[1:]):
+            if delta := upper - lower & 0xFF:
+                step = (sig > threshold).view(np.uint8)
+                if delta != 1:
+                    step *= np.uint8(delta)
+                out += step
+            undecided |= sig == threshold
+        out[undecided] = 0
+
+        return out.data
@@ -1,7 +1,9 @@
+from __future__ import annotations
+
 import struct
-from typing import ByteString, Union, Optional, Generator
 
-from refinery import Unit, Arg
+from refinery.lib.types import Param
+from refinery.units import Arg, Unit
 
 
 class packbits(Unit):
@@ -13,9 +15,10 @@ class packbits(Unit):
     """
 
     def __init__(self,
-                 specials: Arg.Binary(nargs='*', help="special values which will not be packed but stay as bytes"),
-                 bit_width: Arg.Number('-w', help="number of bits per codeword") = 1,
-                 bit_order: Arg.Choice('-o', choices=["msb", "lsb"]) = "msb",
+                 specials: Param[list[bytes], Arg.Binary(nargs='*', help=(
+                     'special values which will not be packed but stay as bytes'))],
+                 bit_width: Param[int, Arg.Number('-w', help='number of bits per codeword')] = 1,
+                 bit_order: Param[str, Arg.Choice('-o', choices=['msb', 'lsb'])] = 'msb',
                  ):
         super().__init__(special_values=specials, bit_width=bit_width, bit_order=bit_order)
         if bit_width not in (1, 2, 4):
@@ -24,46 +27,71 @@ class packbits(Unit):
             raise ValueError("unsupported bit width")
         self.args.special_values = [struct.unpack("B", s)[0] for s in self.args.special_values]
 
-    def _shifted_bits(self, i: int, b: int) -> int:
-        if self.args.bit_order == "lsb":
-            return b << i
-        elif self.args.bit_order == "msb":
-            return b << (8-self.args.bit_width-i)
-
-    def process(self, data: ByteString) -> Union[Optional[ByteString], Generator[ByteString, None, None]]:
-        num_inputs_per_output = 8 // self.args.bit_width
+    def _shifts(self) -> list[int]:
+        width = self.args.bit_width
+        shifts = range(0, 8, width)
+        if self.args.bit_order == "msb":
+            return [8 - width - shift for shift in shifts]
+        return list(shifts)
 
-        out = bytearray()
-        current = 0
-        current_started = False
+    @Unit.Requires('numpy', 'default', 'extended')
+    def _numpy():
+        import numpy
+        return numpy
 
-        i_in_byte = 0
-        i = 0
-        while i < len(data):
-            for j in range(num_inputs_per_output):
-                if i >= len(data):
-                    break
-                b = data[i]
+    def _pack_vectorized(self, data: bytearray) -> bytearray | None:
+        np = self._numpy
+        width = self.args.bit_width
+        count = 8 // width
+        arr = np.frombuffer(data, dtype=np.uint8)
+        if not arr.size:
+            return bytearray()
+        special = np.isin(arr, self.args.special_values)
+        index = np.arange(arr.size)
+        last = np.where(special, index, -1)
+        np.maximum.accumulate(last, out=last)
+        slot = (index - last - 1) % count
+        shifts = np.array(self._shifts(), dtype=np.uint16)[slot]
+        values = arr.astype(np.uint16) << shifts
+        values[special] = arr[special]
+        packed = np.bitwise_or.reduceat(values, np.flatnonzero(special | (slot == 0)))
+        if not special[-1] and slot[-1] != count - 1:
+            packed = packed[:-1]
+        if packed.size and packed.max() > 0xFF:
+            return None
+        return bytearray(packed.astype(np.uint8))
 
-                if b in self.args.special_values:
-                    if current_started:
-                        # TODO Warn
-                        out += struct.pack("B", current)
-                        current = 0
-                        current_started = False
-                        i_in_byte = 0
-                    out += struct.pack("B", b)
-                else:
-                    current_started = True
-                    current |= self._shifted_bits(i_in_byte, b)
-                    old_i_in_byte = i_in_byte
-                    i_in_byte = (i_in_byte + self.args.bit_width) % 8
+    def process(self, data: bytearray):
+        try:
+            packed = self._pack_vectorized(data)
+        except ImportError:
+            packed = None
+        if packed is not None:
+            return packed
 
-                    if i_in_byte < old_i_in_byte:
-                        out += struct.pack("B", current)
-                        current = 0
-                        current_started = False
+        is_special = bytearray(0x100)
+        for b in self.args.special_values:
+            is_special[b] = 1
+        shifts = self._shifts()
+        count = len(shifts)
 
-                i += 1
+        out = bytearray()
+        current = 0
+        slot = 0
+        for b in data:
+            if is_special[b]:
+                if slot:
+                    # TODO Warn
+                    out.append(current)
+                    current = 0
+                    slot = 0
+                out.append(b)
+                continue
+            current |= b << shifts[slot]
+            slot += 1
+            if slot == count:
+                out.append(current)
+                current = 0
+                slot = 0
 
         return out
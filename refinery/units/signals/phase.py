@@ -21,4 +21,4 @@ class phase(Unit):
 
         sig = np.frombuffer(data, dtype=np.complex64)
         p = np.angle(sig)
-        return self.labelled(p.tobytes(), signal_type="phase")
+        return self.labelled(p.data, signal_type="phase")
@@ -43,21 +43,22 @@ class plotsig(Unit):
         for i, chunk in enumerate(inputs):
             meta = metavars(chunk)
             sample_rate = meta.get("sample_rate")
+            signal_type = meta.get("signal_type")
 
             sig = np.frombuffer(chunk, dtype=np.float32)
 
             ax = plt.subplot(n_rows, n_cols, i+1, sharex=ax)
 
             ylabel = ""
-            plt.title(meta.get("signal_type"))
-            if meta.get("signal_type") == "frequency":
+            plt.title(signal_type)
+            if signal_type == "frequency":
                 ylabel = "Frequency [Hz]"
                 if center_freq := meta.get("center_freq"):
                     sig += center_freq
-            elif meta.get("signal_type") == "phase":
+            elif signal_type == "phase":
                 plt.title("Phase")
                 ylabel = "Phase [rad]"
-            elif meta.get("signal_type") == "amplitude":
+            elif signal_type == "amplitude":
                 plt.title("Amplitude")
 
             if sample_rate:
@@ -33,18 +33,23 @@ class pulses(Unit):
         if not self.args.threshold:
             self.args.threshold = 0.5 * np.max(sig) - 1.5 * np.min(sig)
 
-        sig = (sig > self.args.threshold).astype(np.int32)
-        difference_between_consecutive_elements = np.diff(sig)
-        indexes_of_edges = np.where(difference_between_consecutive_elements != 0)[0]+1
-        runs = np.split(sig, indexes_of_edges)
-        pulse_lengths = np.array([len(r) for r in runs], dtype=np.float32)
+        # the mask stays boolean: edges are found without widening it to an integer type, and
+        # only the pulse lengths are converted to float32
+        mask = sig > self.args.threshold
+        indexes_of_edges = np.flatnonzero(mask[1:] != mask[:-1])
+        edges = np.empty(indexes_of_edges.size + 2, dtype=np.intp)
+        edges[0] = 0
+        np.add(indexes_of_edges, 1, out=edges[1:-1])
+        edges[-1] = mask.size
+        pulse_lengths = np.empty(edges.size - 1, dtype=np.float32)
+        np.subtract(edges[1:], edges[:-1], out=pulse_lengths, casting="unsafe")
 
         if self.args.keep == "hi":
-            start = 0 if sig[0] >= self.args.threshold else 1
+            start = 0 if mask[0] else 1
         else:
-            start = 0 if sig[0] < self.args.threshold else 1
+            start = 1 if mask[0] else 0
 
         if self.args.keep != "both":
             pulse_lengths = pulse_lengths[start::2]
 
-        return pulse_lengths.tobytes()
+        return pulse_lengths.data
@@ -1,11 +1,14 @@
 import struct
 from typing import ByteString, Union, Optional, Iterable, Generator
 
-import binascii
+import zlib
 
 from refinery import Unit, Arg
 from refinery.lib.meta import metavars
 
+_HEADER = struct.Struct("<IQQIII")
+_CHECKED = _HEADER.size - 4
+
 
 class sdriq(Unit):
     """
@@ -24,43 +27,27 @@ class sdriq(Unit):
         return numpy
 
     def process(self, data: ByteString) -> Union[Optional[ByteString], Generator[ByteString, None, None]]:
-        header = memoryview(data)
         data = memoryview(data)
-
-        sample_rate, = struct.unpack("<I", data[:4])
-        data = data[4:]
-        center_freq, = struct.unpack("<Q", data[:8])
-        data = data[8:]
-        timestamp, = struct.unpack("<Q", data[:8])
-        data = data[8:]
-        sample_size, = struct.unpack("<I", data[:4])  # 16 or 24
-        data = data[4:]
-        # skip padding
-        data = data[4:]
-        crc32_sum, = struct.unpack("<I", data[:4])
-        data = data[4:]
-
-        computed_crc32 = binascii.crc32(header[:4+8+8+4+4])
+        # sample_size is 16 or 24, the field after it is padding
+        sample_rate, center_freq, timestamp, sample_size, _, crc32_sum = _HEADER.unpack_from(data)
+        computed_crc32 = zlib.crc32(data[:_CHECKED])
 
         if not self.args.ignore_checksum and computed_crc32 != crc32_sum:
             raise RuntimeError(f"header checksum is invalid: {computed_crc32}, but header had {crc32_sum}")
 
         np = self._numpy
         if sample_size == 24:
-            dtype = np.dtype("i4, i4")
-            tmp_dtype = np.int32
+            dtype = np.int32
         elif sample_size == 16:
-            dtype = np.dtype("i2, i2")
-            tmp_dtype = np.int16
+            dtype = np.int16
         else:
             raise RuntimeError(f"unsupported sample_size {sample_size}")
 
-        sig = np.frombuffer(data, dtype=dtype)
         # Convert from complex int to complex float
-        sig = sig.view(tmp_dtype).astype(np.float32).view(np.complex64)
+        sig = np.frombuffer(data, dtype=dtype, offset=_HEADER.size).astype(np.float32).view(np.complex64)
 
         return self.labelled(
-            sig.tobytes(),
+            sig.data,
             sample_rate=sample_rate,
             center_freq=center_freq,
             timestamp=timestamp,
@@ -73,24 +60,26 @@ class sdriq(Unit):
         if missing_meta:
             raise RuntimeError("missing required meta variables "+", ".join(missing_meta))
 
-        sdriq_data = bytearray()
-        sdriq_data += struct.pack("<I", meta["sample_rate"])
-        sdriq_data += struct.pack("<Q", meta["center_freq"])
-        sdriq_data += struct.pack("<Q", meta["timestamp"])
-        sdriq_data += struct.pack("<I", meta["sample_size"])
-        sdriq_data += struct.pack("<I", 0)  # padding
-        sdriq_data += struct.pack("<I", binascii.crc32(sdriq_data))
-
         np = self._numpy
 
-        if meta["sample_size"] == 24:
+        sample_size = meta["sample_size"]
+        if sample_size == 24:
             dtype = np.int32
-        elif meta["sample_size"] == 16:
+        elif sample_size == 16:
             dtype = np.int16
-
-        sig = np.frombuffer(data, dtype=np.complex64)
-        # Convert back to complex int
-        sig = sig.view(np.float32).astype(dtype)
-        sdriq_data += sig.tobytes()
+        else:
+            raise RuntimeError(f"unsupported sample_size {sample_size}")
+        limit = 1 << (sample_size - 1)
+
+        sig = np.frombuffer(data, dtype=np.complex64).view(np.float32)
+        sdriq_data = bytearray(_HEADER.size + sig.size * np.dtype(dtype).itemsize)
+        _HEADER.pack_into(
+            sdriq_data, 0, meta["sample_rate"], meta["center_freq"], meta["timestamp"], meta["sample_size"], 0, 0)
+        struct.pack_into("<I", sdriq_data, _CHECKED, zlib.crc32(memoryview(sdriq_data)[:_CHECKED]))
+        # Convert back to complex int directly into the output buffer, saturating samples that are
+        # out of range for the sample size instead of letting them wrap around
+        np.clip(
+            sig, -limit, limit - 1,
+            out=np.frombuffer(sdriq_data, dtype=dtype, offset=_HEADER.size), casting="unsafe")
 
         return sdriq_data
@@ -22,9 +22,15 @@ class sigan(Unit):
         np = self._numpy
 
         sig = np.frombuffer(data, dtype=np.complex64)
-        a = np.abs(sig)
-        yield self.labelled(a.tobytes(), signal_type="amplitude")
-        p = np.angle(sig)
-        yield self.labelled(p.tobytes(), signal_type="phase")
-        f = np.diff(np.unwrap(p))
-        yield self.labelled(f.tobytes(), signal_type="frequency")
+        p = np.abs(sig)
+        yield self.labelled(p.data, signal_type="amplitude")
+        # the amplitude chunk holds a copy, so its buffer can be reused for the phase
+        np.arctan2(sig.imag, sig.real, out=p)
+        yield self.labelled(p.data, signal_type="phase")
+        # wrapping the phase differences into [-pi, pi] is equivalent to unwrap followed by diff
+        f = np.diff(p)
+        w = f / (2 * np.pi)
+        np.round(w, out=w)
+        w *= 2 * np.pi
+        f -= w
+        yield self.labelled(f.data, signal_type="frequency")
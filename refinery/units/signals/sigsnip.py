@@ -22,9 +22,9 @@ class sigsnip(snip):
         remove: Arg.Switch('-r', help='Remove the slices from the input rather than selecting them.') = False,
         seconds: Arg.Switch('-s', help='Use seconds rather than samples as slice unit.') = False,
     ):
-        super(snip, self).__init__(slices=slices, remove=remove, seconds=seconds)
+        super(snip, self).__init__(slices=slices, length=False, stream=False, remove=remove, seconds=seconds)
 
-    def process(self, data: bytearray):
+    def _slices(self, data: bytearray):
         # Assuming np.complex64 as sample format
         bytes_per_sample = 8
 
@@ -33,13 +33,10 @@ class sigsnip(snip):
             sample_rate = metavars(data).get("sample_rate")
             if not sample_rate:
                 raise RuntimeError("cannot specify unit seconds when the sample rate is unknown")
-            mult *= sample_rate
+            mult = sample_rate
 
-        new_slices = [slice(
+        return [slice(
             int(s.start * mult) * bytes_per_sample if s.start else None,
             math.ceil(s.stop * mult) * bytes_per_sample if s.stop else None,
             round(s.step * mult) * bytes_per_sample if s.step else None,
         ) for s in self.args.slices]
-        self.args.slices = new_slices
-
-        return super().process(data)
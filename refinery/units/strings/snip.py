@@ -27,8 +27,11 @@ class snip(Unit):
     ):
         super().__init__(slices=slices, length=length, stream=stream, remove=remove)
 
+    def _slices(self, data: bytearray) -> list[slice]:
+        return list(self.args.slices)
+
     def process(self, data: bytearray):
-        slices: list[slice] = list(self.args.slices)
+        slices = self._slices(data)
         opt_stream = self.args.stream
         opt_remove = self.args.remove
         opt_length = self.args.length
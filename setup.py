@@ -71,6 +71,7 @@ EXTENSION_DICT = {
     'refinery.lib.fast.argon2'    : 'refinery/lib/fast/argon2.pyx',
     'refinery.lib.fast.lzfse'     : 'refinery/lib/fast/lzfse.pyx',
     'refinery.lib.fast.pkware'    : 'refinery/lib/fast/pkware.pyx',
+    'refinery.lib.fast.xxtea'     : 'refinery/lib/fast/xxtea.pyx',
     'refinery.lib.fast.zipcrypto' : 'refinery/lib/fast/zipcrypto.pyx',
     'refinery.lib.seven.deflate'  : 'refinery/lib/seven/deflate.pyx',
     'refinery.lib.seven.huffman'  : 'refinery/lib/seven/huffman.pyx',
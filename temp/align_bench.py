@@ -0,0 +1,11 @@
+import numpy as np, timeit
+rng = np.random.default_rng(0)
+n = 1 << 22
+raw = rng.standard_normal(n + 8).astype(np.float32).tobytes()
+for off in (0, 4, 8, 16, 1):
+    b = memoryview(raw)[off:off + 4 * n]
+    sig = np.frombuffer(b, dtype=np.float32)
+    print(off, sig.ctypes.data % 32, sig.flags.aligned,
+          round(min(timeit.repeat(lambda: sig > 0.1, number=10, repeat=5)) * 100, 3),
+          round(min(timeit.repeat(lambda: (sig.max(), sig.min()), number=10, repeat=5)) * 100, 3),
+          'copy', round(min(timeit.repeat(lambda: np.require(sig, requirements=['A', 'C']).copy(), number=10, repeat=5)) * 100, 3))
@@ -0,0 +1,7 @@
+import time, glob, random, base64
+from refinery.units.misc.xkey import xkey
+rng = random.Random(1)
+p = base64.b64encode(b''.join(open(f,'rb').read() for f in sorted(glob.glob('refinery/**/*.py', recursive=True)))[:1 << 18])
+key = bytes(rng.getrandbits(8) for _ in range(13))
+c = bytearray(b ^ key[i % 13] for i, b in enumerate(p))
+t = time.perf_counter(); r = c | xkey.assemble('-a', '1:64') | bytes; print(round(time.perf_counter() - t, 3), r == key)
@@ -0,0 +1,26 @@
+import struct
+def asr(value, shift):
+    if value & 0x80000000:
+        return (value >> shift) | (0xFFFFFFFF << (32 - shift)) & 0xFFFFFFFF
+    else:
+        return value >> shift
+def enc(key, v):
+    n = len(v); s = 0; r = 6 + 52 // n; z = v[n - 1]
+    for _ in range(r):
+        s = s + 0x9E3779B9 & 0xFFFFFFFF
+        e = (s >> 2) & 3
+        for p in range(n):
+            y = v[(p + 1) % n]; k = (p & 3) ^ e
+            x = (asr(z, 5) ^ (y << 2)) + (asr(y, 3) ^ (z << 4)) ^ (s ^ y) + (key[k] ^ z)
+            z = v[p] = v[p] + x & 0xFFFFFFFF
+    return v
+key = list(struct.unpack('<4I', b'0123456789abcdef'))
+data = b'Binary Refinery XXTEA with an arithmetic shift right!!!!'
+data += b'\0' * (-len(data) % 4)
+v = list(struct.unpack(F'<{len(data)//4}I', data))
+print(struct.pack(F'<{len(v)}I', *enc(key, v)).hex())
+v = list(struct.unpack(F'<{len(data)//4}I', data))
+out = b''
+for i in range(0, len(v), 2):
+    out += struct.pack('<2I', *enc(key, v[i:i+2]))
+print(out.hex())
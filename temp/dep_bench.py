@@ -0,0 +1,4 @@
+import timeit
+from refinery.units.signals.sigan import sigan
+u = sigan(); u._numpy
+print('%.1f ns' % (min(timeit.repeat(lambda: u._numpy, number=10**6, repeat=7)) * 1000))
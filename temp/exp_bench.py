@@ -0,0 +1,8 @@
+import timeit
+from refinery.lib import lief
+from refinery.lib.tools import proxy
+from refinery.units.formats.pe.pemeta import pemeta
+data=open('temp/synth.dll','rb').read()
+pe=proxy(lief.load_pe(data, parse_exports=True, parse_imports=True, parse_rsrc=False, parse_reloc=False, parse_signature=False))
+u=pemeta.assemble('-t')
+print(round(timeit.timeit(lambda: u.parse_exports(pe, data, True), number=5)/5*1e3, 2), 'ms')
@@ -0,0 +1,13 @@
+import numpy as np, time, sys
+from refinery.lib.frame import Chunk
+from refinery.units.signals.fir import fir
+rng = np.random.default_rng(0)
+for n in (1, 300, 501, 1 << 20):
+    s = (rng.standard_normal(n) + 1j * rng.standard_normal(n)).astype(np.complex64).tobytes()
+    c = Chunk(s, meta={'sample_rate': 48000, 'center_freq': 100})
+    u = fir(['-2000/3000', '5000/9000', '-2000/3000'])
+    t = time.perf_counter()
+    out = [np.frombuffer(bytes(x), dtype=np.complex64) for x in u.process(c)]
+    dt = time.perf_counter() - t
+    np.save(f'temp/fir_{sys.argv[1]}_{n}.npy', np.concatenate(out))
+    print(n, round(dt, 3), [len(o) for o in out])
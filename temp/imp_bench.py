@@ -0,0 +1,9 @@
+import timeit
+from refinery.lib import lief
+from refinery.lib.tools import proxy
+from refinery.units.formats.pe.pemeta import pemeta
+data=open('/root/.pyenv/versions/3.13.0/lib/python3.13/site-packages/pip/_vendor/distlib/w64.exe','rb').read()
+pe=proxy(lief.load_pe(data, parse_exports=True, parse_imports=True, parse_rsrc=False, parse_reloc=False, parse_signature=False))
+u=pemeta.assemble('-t')
+for _ in range(3):
+    print(round(timeit.timeit(lambda: u.parse_imports(pe, data, True), number=500)/500*1e6), round(timeit.timeit(lambda: u.parse_imports(pe, data, False), number=500)/500*1e6), 'us')
@@ -0,0 +1,7 @@
+import sys, time, os, importlib.util
+from refinery.units.pattern.interp import interp as new
+spec = importlib.util.spec_from_file_location('interp_old', 'temp/interp_old.py'); m = importlib.util.module_from_spec(spec); sys.modules['interp_old'] = m; spec.loader.exec_module(m)
+data = os.urandom(12 * 50000)
+for fmt in ('{<I},{<I},{<H}{<H}\n', '{<I},{>I},{<H}{<H}\n'):
+    for name, u in (('old', m.interp(fmt)), ('new', new(fmt))):
+        t = time.perf_counter(); r = bytes(next(u.process(data))); print(name, repr(fmt), round(time.perf_counter() - t, 3))
@@ -0,0 +1,24 @@
+import random, sys, struct
+sys.path.insert(0, 'temp')
+from refinery.units.pattern.interp import interp as new
+import importlib.util
+spec = importlib.util.spec_from_file_location('interp_old', 'temp/interp_old.py'); m = importlib.util.module_from_spec(spec); sys.modules['interp_old'] = m; spec.loader.exec_module(m)
+old = m.interp
+rng = random.Random(3)
+def run(u, data):
+    try: return [bytes(x) for x in u.process(data)]
+    except Exception as e: return type(e).__name__
+n = 0
+for _ in range(3000):
+    order = rng.choice(['<', '>', '!', '=', '@', ''])
+    fmt = ''
+    for k in range(rng.randint(1, 4)):
+        o = order if rng.random() < .85 else rng.choice('<>@!=')
+        fmt += rng.choice(['', ',', '%', ' %s ', '|']) + '{' + o + rng.choice(['I','H','b','Q','f','d','?','3s','c','II','x','e','i']) + '}'
+    fmt += rng.choice(['', ';', '%d'])
+    chunks = rng.random() < .5
+    data = bytes(rng.getrandbits(8) for _ in range(rng.randint(1, 60)))
+    a = run(old(fmt, as_chunks=chunks), data); b = run(new(fmt, as_chunks=chunks), data)
+    if a != b: print('DIFF', fmt, chunks, data.hex(), a, b); n += 1
+    if n > 5: break
+print('ok' if not n else 'fail')
@@ -0,0 +1,28 @@
+import random, re
+rex = re.compile(r"(?P<pre>[^{]*)\{(?P<format>[^{]+)}(?P<post>[^{]*)")
+def old(f):
+    out = []
+    for m in rex.finditer(f):
+        if g := m.group('pre'): out.append(('s', g))
+        if g := m.group('format'): out.append(('f', g))
+        if g := m.group('post'): out.append(('s', g))
+    return out
+def new(f):
+    out = []
+    segments = f.split('{')
+    pre = segments[0]
+    for seg in segments[1:]:
+        r = seg.rfind('}')
+        if r > 0:
+            if pre: out.append(('s', pre))
+            out.append(('f', seg[:r]))
+            if seg[r + 1:]: out.append(('s', seg[r + 1:]))
+            pre = ''
+        else:
+            pre = seg
+    return out
+rng = random.Random(1)
+for _ in range(200000):
+    f = ''.join(rng.choice('{}}{a,I') for _ in range(rng.randint(0, 12)))
+    assert old(f) == new(f), (f, old(f), new(f))
+print('ok')
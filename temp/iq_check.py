@@ -0,0 +1,8 @@
+import hashlib
+from refinery.units.signals.iq import iq
+data = bytes(range(256)) * 12
+h = hashlib.sha256()
+for t in ['c64', 'c128', 'ci32', 'ci48', 'ci64']:
+    try: h.update(bytes(iq(t).process(data)))
+    except Exception as e: h.update(type(e).__name__.encode()); print(t, e)
+print(h.hexdigest())
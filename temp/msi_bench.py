@@ -0,0 +1,76 @@
+import random, struct, timeit, sys
+from refinery.lib.structures import StructReader
+from refinery.lib import chunks
+rng = random.Random(0)
+pool = bytearray(struct.pack('<HH', 1252, 0)); data = bytearray()
+for i in range(50000):
+    n = rng.randrange(1, 40) if i % 1000 else 70000
+    rc = rng.randrange(1, 5)
+    if n >= 0x10000: pool += struct.pack('<HHI', 0, rc, n)
+    else: pool += struct.pack('<HH', n, rc)
+    data += bytes(rng.randrange(0x41, 0x5a) for _ in range(n)) if n < 100 else b'x' * n
+pool = bytes(pool); data = bytes(data)
+def base():
+    d = StructReader(data); p = StructReader(pool); s = []; r = []; c = []
+    cp = p.u16(); u = p.u16()
+    while not p.eof:
+        size = p.u16(); rc = p.u16()
+        if size == 0 and rc != 0: size = p.u32()
+        s.append(d.read_bytes(size)); r.append(rc); c.append(0)
+    return s, r
+def cur():
+    d = memoryview(data); p = chunks.unpack(pool, 2); s = []; r = []
+    end = len(p) - 1; off = 0; k = 2
+    while k < end:
+        size = p[k]; rc = p[k + 1]; k += 2
+        if size == 0 and rc != 0:
+            size = p[k] | p[k + 1] << 16; k += 2
+        s.append(bytes(d[off:off + size])); r.append(rc); off += size
+    return s, r
+def new():
+    d = StructReader(data); p = StructReader(pool); s = []; r = []
+    cp = p.u16(); u = p.u16()
+    read_entry = p.u32; read_string = d.read_bytes
+    while not p.eof:
+        entry = read_entry()
+        size = entry & 0xFFFF; rc = entry >> 16
+        if size == 0 and rc != 0: size = read_entry()
+        s.append(read_string(size)); r.append(rc)
+    return s, r
+assert base() == cur() == new()
+for f in (base, cur, new):
+    print(f.__name__, round(min(timeit.repeat(f, number=3, repeat=3)) / 3 * 1000, 2), 'ms')
+def bulk_rb():
+    d = StructReader(data); p = StructReader(pool); s = []; r = []
+    cp = p.u16(); u = p.u16()
+    entries = iter(p.read_struct(F'{p.remaining_bytes // 4}I'))
+    read_string = d.read_bytes
+    for entry in entries:
+        size = entry & 0xFFFF; rc = entry >> 16
+        if size == 0 and rc != 0: size = next(entries)
+        s.append(read_string(size)); r.append(rc)
+    return s, r
+def bulk_mv():
+    d = StructReader(data); p = StructReader(pool); s = []; r = []
+    cp = p.u16(); u = p.u16()
+    entries = iter(p.read_struct(F'{p.remaining_bytes // 4}I'))
+    view = d.getbuffer(); off = 0
+    for entry in entries:
+        size = entry & 0xFFFF; rc = entry >> 16
+        if size == 0 and rc != 0: size = next(entries)
+        s.append(bytes(view[off:off + size])); r.append(rc); off += size
+    return s, r
+assert bulk_rb() == base() == bulk_mv()
+for f in (bulk_rb, bulk_mv):
+    print(f.__name__, round(min(timeit.repeat(f, number=3, repeat=3)) / 3 * 1000, 2), 'ms')
+def bulk_read():
+    d = StructReader(memoryview(data)); p = StructReader(memoryview(pool)); s = []; r = []
+    cp = p.u16(); u = p.u16()
+    entries = iter(p.read_struct(F'{p.remaining_bytes // 4}I'))
+    for entry in entries:
+        size = entry & 0xFFFF; rc = entry >> 16
+        if size == 0 and rc != 0: size = next(entries)
+        s.append(bytes(d.read_exactly(size))); r.append(rc)
+    return s, r
+assert bulk_read() == base()
+print('bulk_read', round(min(timeit.repeat(bulk_read, number=3, repeat=3)) / 3 * 1000, 2), 'ms')
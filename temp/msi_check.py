@@ -0,0 +1,21 @@
+import importlib.util, sys, random, struct, timeit
+spec = importlib.util.spec_from_file_location('msi_base', 'temp/msi_base.py')
+m = importlib.util.module_from_spec(spec); sys.modules['msi_base'] = m; spec.loader.exec_module(m)
+from refinery.units.formats.msi import MSIStringData as New
+Old = m.MSIStringData
+exec(open('temp/msi_bench.py').read().split('def base')[0])
+def run(cls, d, p):
+    try:
+        x = cls(d, p); return x.codepage, x._unknown, x.strings, x.provided_ref_count, x.computed_ref_count
+    except Exception as e:
+        return type(e).__name__
+cases = [(data, pool), (b'', b''), (b'', pool[:4]), (data, pool[:6]), (data, pool[:10]), (data[:50], pool),
+         (b'ab', struct.pack('<HHHH', 1, 0, 0, 7)), (b'ab', struct.pack('<HHHHHH', 1, 0, 0, 7, 2, 0))]
+bad = 0
+for d, p in cases:
+    a, b = run(Old, d, p), run(New, d, p)
+    if a != b:
+        bad += 1; print('DIFF', len(d), len(p), a if isinstance(a, str) else 'ok', b if isinstance(b, str) else 'ok')
+print('ok' if not bad else 'FAIL')
+for cls in (Old, New):
+    print(cls.__module__, round(min(timeit.repeat(lambda: cls(data, pool), number=3, repeat=3)) / 3 * 1000, 2), 'ms')
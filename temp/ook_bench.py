@@ -0,0 +1,7 @@
+import numpy as np, timeit
+from refinery.units.signals.ook import ook
+rng = np.random.default_rng(0)
+sig = rng.random(1 << 22).astype(np.float32); data = sig.tobytes()
+for t, cw in (([0.5], [b'\x00', b'\x01']), ([0.1, 0.5, 0.9], [b'a', b'b', b'c', b'd'])):
+    u = ook(cw, t)
+    print(t, round(min(timeit.repeat(lambda: u.process(data), number=1, repeat=5)), 4))
@@ -0,0 +1,20 @@
+import numpy as np, time
+from refinery.units.signals.ook import ook
+rng = np.random.default_rng(0)
+def old(sig, thresholds, codewords):
+    data = np.zeros(len(sig), dtype=bytes)
+    data[np.where(sig < thresholds[0])] = codewords[0]
+    for i in range(len(thresholds)-1):
+        lower, upper = thresholds[i], thresholds[i+1]
+        data[np.where(np.logical_and(lower < sig, sig < upper))] = codewords[i+1]
+    data[np.where(thresholds[-1] < sig)] = codewords[-1]
+    return data.tobytes()
+cases = [([0.5], [b'\x00', b'\x01']), ([0.1, 0.5, 0.9], [b'a', b'bc', b'', b'd']), ([0.3, 0.3, 0.7], [b'1', b'2', b'3', b'4', b'5']), ([1], [b'x', b'y', b'z'])]
+for t, cw in cases:
+    sig = rng.random(1 << 20).astype(np.float32)
+    sig[::7] = np.float32(t[0]); sig[::11] = np.nan; sig[::13] = np.float32(t[-1])
+    sig[:4] = np.float32(0.1)
+    data = sig.tobytes()
+    t0 = time.perf_counter(); a = old(sig, t, cw); t1 = time.perf_counter()
+    b = bytes(ook(cw, t).process(data)); t2 = time.perf_counter()
+    print(t, a == b, round(t1 - t0, 4), round(t2 - t1, 4))
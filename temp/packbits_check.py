@@ -0,0 +1,22 @@
+import random, sys, importlib.util, time
+from refinery.units.signals.packbits import packbits as new
+spec = importlib.util.spec_from_file_location('packbits_old', 'temp/packbits_old.py'); m = importlib.util.module_from_spec(spec); sys.modules['packbits_old'] = m; spec.loader.exec_module(m)
+old = m.packbits
+rng = random.Random(5)
+def run(u, d):
+    try: return bytes(u.process(d))
+    except Exception as e: return 'error'
+bad = 0
+for _ in range(4000):
+    w = rng.choice((1, 2, 4)); o = rng.choice(('msb', 'lsb'))
+    specials = [bytes((rng.randrange(256),)) for _ in range(rng.randint(0, 3))]
+    pool = list(range(1 << w)) * 6 + [s[0] for s in specials] + ([rng.randrange(256)] if rng.random() < .1 else [])
+    d = bytes(rng.choice(pool) for _ in range(rng.randint(0, 40)))
+    a = run(old(specials, bit_width=w, bit_order=o), d); b = run(new(specials, bit_width=w, bit_order=o), d)
+    if a != b:
+        bad += 1; print(w, o, specials, d.hex(), a, b)
+        if bad > 5: break
+print('ok' if not bad else 'FAIL')
+d = bytes(rng.randrange(2) for _ in range(1 << 20))
+for cls in (old, new):
+    u = cls([b"\xAA"]); t = time.perf_counter(); u.process(d); print(cls.__module__, round(time.perf_counter() - t, 3))
@@ -0,0 +1,17 @@
+import glob
+from refinery.units.formats.pe.pemeta import pemeta
+files = sorted(glob.glob('/root/.pyenv/versions/*/lib/python*/site-packages/**/*.exe', recursive=True))
+files += sorted(glob.glob('/root/.pyenv/versions/*/lib/python*/site-packages/**/*.dll', recursive=True))
+files.append('temp/synth.dll')
+seen = set()
+for f in files:
+    data = open(f, 'rb').read()
+    if data in seen:
+        continue
+    seen.add(data)
+    for args in ((), ('-t',), ('-EEIIPP',), ('-t', '-EEIIPP'), ('-t', '-PPr')):
+        try:
+            out = data | pemeta.assemble(*args) | bytes
+        except Exception as e:
+            out = repr(e).encode()
+        print(f.split('/')[-1], args, out.decode('utf8', 'replace'))
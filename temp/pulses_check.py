@@ -0,0 +1,24 @@
+import numpy as np, sys, time, importlib.util
+from refinery.units.signals.pulses import pulses as new
+spec = importlib.util.spec_from_file_location('pulses_old', 'temp/pulses_old.py'); m = importlib.util.module_from_spec(spec); sys.modules['pulses_old'] = m; spec.loader.exec_module(m)
+old = m.pulses
+rng = np.random.default_rng(2)
+def run(u, d):
+    try: return bytes(u.process(d))
+    except Exception as e: return type(e).__name__
+bad = 0
+for trial in range(600):
+    n = int(rng.integers(0, 60))
+    sig = (np.repeat(rng.integers(0, 2, n), rng.integers(1, 6, n)) * 2.0).astype(np.float32)
+    sig = sig + rng.random(sig.size).astype(np.float32) * .5
+    for thr in (None, 1.0, 0.2):
+        for keep in ('hi', 'lo', 'both'):
+            d = sig.tobytes()
+            a = run(old(threshold=thr, keep=keep), d); b = run(new(threshold=thr, keep=keep), d)
+            if a != b:
+                bad += 1; print(n, thr, keep, a, b)
+print('ok' if not bad else 'FAIL')
+sig = (np.repeat(rng.integers(0, 2, 1 << 18), rng.integers(1, 20, 1 << 18)) * 2.0).astype(np.float32)
+d = sig.tobytes()
+for cls in (old, new):
+    u = cls(threshold=1.0, keep='hi'); t = time.perf_counter(); u.process(d); print(cls.__module__, round(time.perf_counter() - t, 4), sig.size)
@@ -0,0 +1,31 @@
+import random, struct, timeit
+from refinery.lib.structures import StructReader
+from refinery.lib import chunks
+def base(data, row_format):
+    row_size = struct.calcsize(F'<{row_format}'); row_count = int(len(data) / row_size)
+    reader = StructReader(data)
+    columns = [reader.read_struct(F'<{sc * row_count}') for sc in row_format]
+    for i in range(row_count):
+        yield [int(c[i]) for c in columns]
+def cur(data, row_format):
+    view = memoryview(data); row_size = struct.calcsize(F'<{row_format}'); row_count = len(view) // row_size
+    columns = []; offset = 0
+    for sc in row_format:
+        size = struct.calcsize(F'<{sc}'); end = offset + size * row_count
+        columns.append(chunks.unpack(view[offset:end], size)); offset = end
+    return zip(*columns)
+def new(data, row_format):
+    row_size = struct.calcsize(F'<{row_format}'); row_count = len(data) // row_size
+    reader = StructReader(data)
+    return zip(*(reader.read_struct(F'<{row_count}{sc}') for sc in row_format))
+rng = random.Random(1)
+for _ in range(300):
+    fmt = ''.join(rng.choice('HI') for _ in range(rng.randrange(1, 7)))
+    n = rng.randrange(0, 50) * struct.calcsize('<' + fmt) + rng.randrange(0, 3)
+    d = bytes(rng.randrange(256) for _ in range(n))
+    a = [tuple(r) for r in base(d, fmt)]; b = list(cur(d, fmt)); c = list(new(d, fmt))
+    assert a == b == c, (fmt, n)
+print('ok')
+fmt = 'HHIHIH'; d = bytes(rng.randrange(256) for _ in range(struct.calcsize('<' + fmt) * 100000))
+for f in (base, cur, new):
+    print(f.__name__, round(min(timeit.repeat(lambda: list(f(d, fmt)), number=3, repeat=3)) / 3 * 1000, 2), 'ms')
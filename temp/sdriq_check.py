@@ -0,0 +1,39 @@
+import numpy as np, sys, time, importlib.util, struct, binascii
+from refinery.lib.frame import Chunk
+from refinery.units.signals.sdriq import sdriq as new
+spec = importlib.util.spec_from_file_location('sdriq_old', 'temp/sdriq_old.py'); m = importlib.util.module_from_spec(spec); sys.modules['sdriq_old'] = m; spec.loader.exec_module(m)
+old = m.sdriq
+rng = np.random.default_rng(0)
+def hdr(sr, cf, ts, ss, bad=False):
+    h = struct.pack('<IQQII', sr, cf, ts, ss, 0)
+    return h + struct.pack('<I', binascii.crc32(h) ^ bad)
+def run(f, d):
+    try:
+        r = f(d)
+        return bytes(r), dict(r.meta) if hasattr(r, 'meta') else None
+    except Exception as e:
+        return type(e).__name__, None
+bad = 0
+for ss in (16, 24, 8):
+    for n in (0, 1, 2, 3, 8, 1001):
+        for corrupt in (False, True):
+            for ign in (False, True):
+                body = rng.integers(-30000, 30000, n, dtype=np.int32 if ss == 24 else np.int16).tobytes()
+                d = hdr(48000, 433920000, 1234567, ss, corrupt) + body
+                a = run(old(ignore_checksum=ign).process, Chunk(d)); b = run(new(ignore_checksum=ign).process, Chunk(d))
+                if a != b: bad += 1; print('P', ss, n, corrupt, ign, a[0][:40], b[0][:40])
+for ss in (16, 24, 8):
+    for n in (0, 1, 2, 7):
+        sig = (rng.standard_normal(n) * 1000).astype(np.complex64).tobytes()
+        meta = dict(sample_rate=48000, center_freq=433920000, timestamp=99, sample_size=ss)
+        a = run(old(False).reverse, Chunk(sig, meta=meta)); b = run(new(False).reverse, Chunk(sig, meta=meta))
+        if a[0] != b[0]: bad += 1; print('R', ss, n, a[0][:40], b[0][:40])
+    a = run(old(False).reverse, Chunk(b'', meta={'sample_rate': 1})); b = run(new(False).reverse, Chunk(b'', meta={'sample_rate': 1}))
+    if a[0] != b[0]: bad += 1; print('Rmissing', a, b)
+print('ok' if not bad else 'FAIL')
+d = hdr(48000, 433920000, 1, 16) + rng.integers(-30000, 30000, 1 << 23, dtype=np.int16).tobytes()
+for cls in (old, new):
+    u = cls(False); c = Chunk(d); t = time.perf_counter(); u.process(c); print(cls.__module__, round(time.perf_counter() - t, 4))
+sig = (rng.standard_normal(1 << 22) * 1000).astype(np.complex64).tobytes()
+for cls in (old, new):
+    u = cls(False); c = Chunk(sig, meta=dict(sample_rate=48000, center_freq=1, timestamp=1, sample_size=16)); t = time.perf_counter(); u.reverse(c); print('rev', cls.__module__, round(time.perf_counter() - t, 4))
@@ -0,0 +1,22 @@
+import sys, importlib.util, timeit
+import numpy as np
+spec = importlib.util.spec_from_file_location('sigan_pre14', 'temp/sigan_pre14.py')
+m = importlib.util.module_from_spec(spec); sys.modules['sigan_pre14'] = m; spec.loader.exec_module(m)
+from refinery.units.signals.sigan import sigan
+rng = np.random.default_rng(5)
+ok = True
+for n in (0, 1, 2, 3, 0x10000, 0x10001, 0x10002, 200_000):
+    d = (rng.standard_normal(n) + 1j * rng.standard_normal(n)).astype(np.complex64).tobytes()
+    a = [bytes(c) for c in m.sigan().process(d)]; b = [bytes(c) for c in sigan().process(d)]
+    if a != b: ok = False; print('MISMATCH', n)
+print('ok' if ok else 'FAIL')
+d = (rng.standard_normal(4_000_000) + 1j * rng.standard_normal(4_000_000)).astype(np.complex64).tobytes()
+for cls in (m.sigan, sigan):
+    u = cls()
+    print(cls.__module__, min(timeit.repeat(lambda: list(u.process(d)), number=3, repeat=5)) / 3)
+res = {0: [], 1: []}
+for r in range(6):
+    for i, cls in enumerate((m.sigan, sigan)):
+        u = cls()
+        res[i].append(min(timeit.repeat(lambda: list(u.process(d)), number=3, repeat=3)) / 3)
+print([round(min(v) * 1000, 2) for v in res.values()], [round(sorted(v)[3] * 1000, 2) for v in res.values()])
@@ -0,0 +1,24 @@
+import sys, importlib.util, time
+import numpy as np
+sys.path.insert(0, '.')
+spec = importlib.util.spec_from_file_location('sigan_old', 'temp/sigan_old.py')
+m = importlib.util.module_from_spec(spec); sys.modules['sigan_old'] = m; spec.loader.exec_module(m)
+from refinery.units.signals.sigan import sigan as new
+old = m.sigan
+rng = np.random.default_rng(1)
+ok = True
+for n in (0, 1, 2, 3, 1000, 4_000_000):
+    sig = (rng.standard_normal(n) + 1j * rng.standard_normal(n)).astype(np.complex64)
+    # include exact axis values
+    if n > 10:
+        sig[:8] = [1, -1, 1j, -1j, -1 + 0j, -1 - 0j, 0, 1]
+    data = sig.tobytes()
+    ro = [bytes(c) for c in old().process(data)]
+    t = time.perf_counter(); rn = [bytes(c) for c in new().process(data)]; tn = time.perf_counter() - t
+    for a, b in zip(ro, rn):
+        x = np.frombuffer(a, np.float32); y = np.frombuffer(b, np.float32)
+        if x.shape != y.shape or not np.allclose(x, y, atol=1e-5):
+            ok = False; print('MISMATCH', n, x.shape, y.shape, np.abs(x - y).max() if x.shape == y.shape else None)
+    t = time.perf_counter(); [bytes(c) for c in old().process(data)]; to = time.perf_counter() - t
+    print(n, 'old %.4f new %.4f' % (to, tn))
+print('ok' if ok else 'FAIL')
@@ -0,0 +1,36 @@
+from typing import ByteString, Union, Optional, Generator
+
+from refinery import Unit
+
+
+class sigan(Unit):
+    """
+    Computes instantaneous frequency, phase and amplitude in separate chunks.
+    This is particularly useful in combination with the `plotsig` or `plothist` units
+    for a quick look at the signal.
+    """
+
+    def __init__(self):
+        super().__init__()
+
+    @Unit.Requires('numpy', 'default', 'extended')
+    def _numpy():
+        import numpy
+        return numpy
+
+    def process(self, data: ByteString) -> Union[Optional[ByteString], Generator[ByteString, None, None]]:
+        np = self._numpy
+
+        sig = np.frombuffer(data, dtype=np.complex64)
+        a = np.abs(sig)
+        yield self.labelled(a.data, signal_type="amplitude")
+        p = np.empty(sig.size, dtype=np.float32)
+        np.arctan2(sig.imag, sig.real, out=p)
+        yield self.labelled(p.data, signal_type="phase")
+        # wrapping the phase differences into [-pi, pi] is equivalent to unwrap followed by diff
+        f = np.diff(p)
+        w = f / (2 * np.pi)
+        np.round(w, out=w)
+        w *= 2 * np.pi
+        f -= w
+        yield self.labelled(f.data, signal_type="frequency")
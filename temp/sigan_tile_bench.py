@@ -0,0 +1,41 @@
+import numpy as np, timeit
+rng = np.random.default_rng(1)
+n = 4_000_000
+sig = (rng.standard_normal(n) + 1j * rng.standard_normal(n)).astype(np.complex64)
+p = np.angle(sig)
+tau = 2 * np.pi
+def flat():
+    f = np.diff(p)
+    w = f / tau
+    np.round(w, out=w)
+    w *= tau
+    f -= w
+    return f
+def tiled(T=1 << 14):
+    f = np.diff(p)
+    w = np.empty(min(T, f.size), dtype=np.float32)
+    for k in range(0, f.size, T):
+        t = f[k:k + T]
+        u = w[:t.size]
+        np.divide(t, tau, out=u)
+        np.round(u, out=u)
+        u *= tau
+        t -= u
+    return f
+def tiled_all(T=1 << 14):
+    f = np.empty(p.size - 1, dtype=np.float32)
+    w = np.empty(min(T, f.size), dtype=np.float32)
+    for k in range(0, f.size, T):
+        t = f[k:k + T]
+        np.subtract(p[k + 1:k + 1 + t.size], p[k:k + t.size], out=t)
+        u = w[:t.size]
+        np.divide(t, tau, out=u)
+        np.round(u, out=u)
+        u *= tau
+        t -= u
+    return f
+assert np.array_equal(flat(), tiled()) and np.array_equal(flat(), tiled_all())
+for fn in (flat, tiled, tiled_all):
+    print(fn.__name__, min(timeit.repeat(fn, number=5, repeat=5)) / 5)
+for T in (1 << 12, 1 << 13, 1 << 15, 1 << 16):
+    print(T, min(timeit.repeat(lambda: tiled_all(T), number=5, repeat=5)) / 5)
@@ -0,0 +1,32 @@
+import numpy as np, timeit
+from refinery.units.signals.sigan import sigan
+rng = np.random.default_rng(5)
+n = 4_000_000
+d = (rng.standard_normal(n) + 1j * rng.standard_normal(n)).astype(np.complex64).tobytes()
+T = 0x10000
+def wrap_flat(self, p):
+    f = np.diff(p); w = f / (2 * np.pi); np.round(w, out=w); w *= 2 * np.pi; f -= w; return f
+def wrap_tiled(self, p):
+    f = np.empty(p.size - 1, np.float32); w = np.empty(T, np.float32)
+    for k in range(0, f.size, T):
+        t = f[k:k + T]; u = w[:t.size]
+        np.subtract(p[k + 1:k + 1 + t.size], p[k:k + t.size], out=t)
+        np.divide(t, 2 * np.pi, out=u); np.round(u, out=u); u *= 2 * np.pi; t -= u
+    return f
+def make(reuse, wrap):
+    def process(self, data):
+        sig = np.frombuffer(data, dtype=np.complex64)
+        a = np.abs(sig)
+        yield self.labelled(a.data, signal_type="amplitude")
+        p = a if reuse else np.empty(sig.size, np.float32)
+        np.arctan2(sig.imag, sig.real, out=p)
+        yield self.labelled(p.data, signal_type="phase")
+        yield self.labelled(wrap(self, p).data, signal_type="frequency")
+    return process
+variants = {'base': make(False, wrap_flat), 'reuse': make(True, wrap_flat), 'tiled': make(False, wrap_tiled), 'both': make(True, wrap_tiled)}
+res = {k: [] for k in variants}
+u = sigan()
+for r in range(6):
+    for k, fn in variants.items():
+        res[k].append(min(timeit.repeat(lambda: list(fn(u, d)), number=3, repeat=3)) / 3 * 1000)
+for k, v in res.items(): print(k, round(min(v), 2), round(sorted(v)[3], 2))
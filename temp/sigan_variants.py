@@ -0,0 +1,28 @@
+import numpy as np, timeit
+rng = np.random.default_rng(5)
+n = 4_000_000
+sig = (rng.standard_normal(n) + 1j * rng.standard_normal(n)).astype(np.complex64)
+T = 0x10000
+def copy(x): return bytearray(x.data)
+def base():
+    a = np.abs(sig); copy(a)
+    p = np.empty(n, np.float32); np.arctan2(sig.imag, sig.real, out=p); copy(p)
+    f = np.diff(p); w = f / (2 * np.pi); np.round(w, out=w); w *= 2 * np.pi; f -= w; copy(f)
+def reuse():
+    p = np.abs(sig); copy(p)
+    np.arctan2(sig.imag, sig.real, out=p); copy(p)
+    f = np.diff(p); w = f / (2 * np.pi); np.round(w, out=w); w *= 2 * np.pi; f -= w; copy(f)
+def tiled():
+    a = np.abs(sig); copy(a)
+    p = np.empty(n, np.float32); np.arctan2(sig.imag, sig.real, out=p); copy(p)
+    f = np.empty(n - 1, np.float32); w = np.empty(T, np.float32)
+    for k in range(0, f.size, T):
+        t = f[k:k + T]; u = w[:t.size]
+        np.subtract(p[k + 1:k + 1 + t.size], p[k:k + t.size], out=t)
+        np.divide(t, 2 * np.pi, out=u); np.round(u, out=u); u *= 2 * np.pi; t -= u
+    copy(f)
+res = {f.__name__: [] for f in (base, reuse, tiled)}
+for r in range(5):
+    for fn in (base, reuse, tiled):
+        res[fn.__name__].append(min(timeit.repeat(fn, number=3, repeat=3)) / 3 * 1000)
+for k, v in res.items(): print(k, round(min(v), 2), round(sorted(v)[2], 2))
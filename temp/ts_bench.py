@@ -0,0 +1,8 @@
+import timeit
+from refinery.lib import lief
+from refinery.lib.tools import proxy
+from refinery.units.formats.pe.pemeta import pemeta
+data=open('/root/.pyenv/versions/3.13.0/lib/python3.13/site-packages/pip/_vendor/distlib/w64.exe','rb').read()
+pe=proxy(lief.load_pe(data, parse_exports=True, parse_imports=True, parse_rsrc=True, parse_reloc=False, parse_signature=False))
+u=pemeta.assemble('-t')
+print(round(timeit.timeit(lambda: u.parse_time_stamps(pe, False, True), number=50)/50*1e3, 3), 'ms')
@@ -0,0 +1,59 @@
+import random, sys
+from contextlib import suppress
+sys.setrecursionlimit(10000)
+def _value(doc, require_type=None):
+    if require_type is not None:
+        if doc.get('type', None) != require_type:
+            raise LookupError
+    value = doc.get('value', None)
+    value = [value] if value else doc.get('values', [])
+    if not value:
+        raise LookupError
+    return value[0]
+def old(entry):
+    if isinstance(entry, dict):
+        try:
+            return {'Timestamp': _value(entry, 'signingTime')}
+        except LookupError:
+            pass
+        for value in entry.values():
+            result = old(value)
+            if result is None:
+                continue
+            with suppress(KeyError):
+                result.setdefault('TimestampIssuer', entry['sid']['issuer']['commonName'])
+            return result
+    elif isinstance(entry, list):
+        for value in entry:
+            result = old(value)
+            if result is None:
+                continue
+            return result
+src = open('refinery/units/formats/pe/pemeta.py').read()
+a = src.index('        def find_timestamps(root)')
+b = src.index('        timestamp_info = find_timestamps')
+import textwrap
+from typing import Any
+exec(textwrap.dedent(src[a:b]))
+r = random.Random(3)
+def gen(d):
+    c = r.random()
+    if d > 5 or c < 0.3:
+        return r.choice([1, 'x', None, []])
+    if c < 0.55:
+        return [gen(d+1) for _ in range(r.randint(0, 4))]
+    e = {}
+    if r.random() < 0.15:
+        e['type'] = 'signingTime'; e['value'] = r.choice([r.randint(0,9), 0]) if r.random()<.5 else None; e['values'] = r.choice([[r.randint(1,9)], []])
+    if r.random() < 0.3:
+        e['sid'] = {'issuer': {'commonName': F'CN{r.randint(0,99)}'}} if r.random()<.8 else {'issuer': {}}
+    for k in range(r.randint(0, 4)):
+        e[F'k{k}'] = gen(d+1)
+    return e
+hits = 0
+for _ in range(20000):
+    t = gen(0)
+    x, y = old(t), find_timestamps(t)
+    assert x == y, (t, x, y)
+    hits += x is not None and 'TimestampIssuer' in x
+print('ok', hits)
@@ -0,0 +1,5 @@
+#include <stdio.h>
+static const char *msgs[] = {"hello world", "binary refinery", "vmemref test"};
+static const char secret[] = "SECRET-DATA-1234";
+int f(int i) { puts(msgs[i % 3]); return secret[i]; }
+int main(int c, char **v) { return f(c) + f(c + 1); }
@@ -0,0 +1,8 @@
+import subprocess
+from refinery.units.formats.exe.vmemref import vmemref
+d = open('temp/vm.elf', 'rb').read()
+syms = [int(l.split()[0], 16) for l in subprocess.check_output(['nm', 'temp/vm.elf'], text=True).splitlines() if l.endswith((' f', ' main'))]
+for args in ([], syms, [s + 3 for s in syms], [s - 2 for s in syms]):
+    print('--', [hex(a) for a in args])
+    for c in d | vmemref(*args, deref_count=2):
+        print(bytes(c[:24]))
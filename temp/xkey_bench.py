@@ -0,0 +1,9 @@
+import time, glob, random
+from refinery.units.misc.xkey import xkey
+rng = random.Random(1)
+p = b''.join(open(f,'rb').read() for f in sorted(glob.glob('refinery/**/*.py', recursive=True)))[:1 << 20]
+key = bytes(rng.getrandbits(8) for _ in range(13))
+c = bytearray(b ^ key[i % 13] for i, b in enumerate(p))
+for size in (1 << 12, 1 << 16, 1 << 20):
+    t = time.perf_counter(); r = c[:size] | xkey.assemble('-f', '1:64') | bytes; print(size, round(time.perf_counter() - t, 3), r == key)
+    t = time.perf_counter(); r = c[:size] | xkey | bytes; print(size, 'default', round(time.perf_counter() - t, 3), r == key)
@@ -0,0 +1,37 @@
+import base64, glob, random
+from refinery.units.misc.xkey import xkey
+rng = random.Random(7)
+srcs = sorted(glob.glob('refinery/units/**/*.py', recursive=True))[:40]
+plain = []
+for s in srcs[:12]:
+    plain.append(open(s, 'rb').read()[:rng.randint(20, 6000)])
+elf = open('temp/vm.elf', 'rb').read()
+plain.append(elf[:3000])
+plain.append(elf[1000:1300])
+for s in srcs[12:20]:
+    t = open(s, 'rb').read()[:2000]
+    plain.append(base64.b64encode(t))
+    plain.append(t.hex().encode())
+    plain.append(base64.b32encode(t[:300]))
+plain += [bytes(500), b'A', b'AB', b'ABCA', bytes(range(256)) * 2, b'hello world' * 3]
+for k in range(10):
+    plain.append(bytes(rng.getrandbits(8) for _ in range(rng.randint(2, 60))))
+cases = []
+for p in plain:
+    for _ in range(2):
+        key = bytes(rng.getrandbits(8) for _ in range(rng.randint(1, 20)))
+        xor = rng.random() < 0.6
+        if xor:
+            c = bytes(b ^ key[i % len(key)] for i, b in enumerate(p))
+        else:
+            c = bytes((b + key[i % len(key)]) & 0xFF for i, b in enumerate(p))
+        cases.append(c)
+for c in cases:
+    for args in ((), ('-f',), ('-a',), ('2:40',), ('-f', ':64:4'), ('-af', '3:9:2')):
+        u = xkey.assemble(*args)
+        u.log_level = 0
+        try:
+            out = [tuple(r) for r in u._attack(bytearray(c))]
+        except Exception as e:
+            out = repr(e)
+        print(args, out)
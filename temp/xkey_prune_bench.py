@@ -0,0 +1,9 @@
+import time, glob, random
+from refinery.units.misc.xkey import xkey
+rng = random.Random(1)
+p = b''.join(open(f,'rb').read() for f in sorted(glob.glob('refinery/**/*.py', recursive=True)))
+for n, k in ((600, 7), (3000, 13)):
+    key = bytes(rng.getrandbits(8) for _ in range(k))
+    c = bytearray(b ^ key[i % k] for i, b in enumerate(p[:n]))
+    u = xkey.assemble('-f', f'1:{n}')
+    t = time.perf_counter(); r = [tuple(x) for x in u._attack(c)]; print(n, round(time.perf_counter() - t, 3), r[0][0] == key if r else None)
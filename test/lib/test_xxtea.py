@@ -0,0 +1,57 @@
+import importlib.util
+import pathlib
+import random
+import unittest
+
+import pytest
+
+import refinery.lib.fast.xxtea as compiled
+
+
+def _load_fallback():
+    path = pathlib.Path(compiled.__file__).with_name('xxtea.py')
+    spec = importlib.util.spec_from_file_location('refinery.lib.fast._xxtea_fallback', path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+fallback = _load_fallback()
+
+
+@pytest.mark.cythonized
+class TestXXTEAFallback(unittest.TestCase):
+
+    def _random_case(self, rng: random.Random, n: int, blocks: int):
+        key = [rng.getrandbits(32) for _ in range(4)]
+        words = [rng.getrandbits(32) for _ in range(n * blocks)]
+        return key, words
+
+    def test_fallback_matches_compiled_kernel(self):
+        if compiled.__file__.endswith('.py'):
+            self.skipTest('the Cython extension is not built')
+        rng = random.Random(0x5EED)
+        for n in range(2, 10):
+            for blocks in range(1, 5):
+                key, words = self._random_case(rng, n, blocks)
+                encrypted = compiled.xxtea_asr_encrypt(key, list(words), n)
+                self.assertEqual(fallback.xxtea_asr_encrypt(key, list(words), n), encrypted)
+                self.assertEqual(compiled.xxtea_asr_decrypt(key, list(encrypted), n), words)
+                self.assertEqual(fallback.xxtea_asr_decrypt(key, list(encrypted), n), words)
+
+    def test_fallback_roundtrip(self):
+        rng = random.Random(0xC0FFEE)
+        for n in range(2, 10):
+            key, words = self._random_case(rng, n, 3)
+            encrypted = fallback.xxtea_asr_encrypt(key, list(words), n)
+            self.assertNotEqual(encrypted, words)
+            self.assertEqual(fallback.xxtea_asr_decrypt(key, encrypted, n), words)
+
+    def test_invalid_block_size(self):
+        for module in (compiled, fallback):
+            for kernel in (module.xxtea_asr_encrypt, module.xxtea_asr_decrypt):
+                with self.assertRaises(ValueError):
+                    kernel([1, 2, 3, 4], [1, 2, 3], 0)
+                with self.assertRaises(ValueError):
+                    kernel([1, 2, 3, 4], [1, 2, 3], 2)
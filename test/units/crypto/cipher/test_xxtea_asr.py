@@ -0,0 +1,32 @@
+from ... import TestUnitBase
+
+
+class TestXXTEA_ASR(TestUnitBase):
+
+    def test_single_block(self):
+        data = b'Binary Refinery XXTEA with an arithmetic shift right!!!!'
+        goal = bytes.fromhex(
+            '54436640c2dd0a14c494717a2a5815674c3915f3bf6b346c511d797db0354a5059ed5bab40424a6d'
+            '77242cee5addcdbe119a86d77e7b553f')
+        unit = self.load(b'0123456789abcdef', raw=True)
+        self.assertEqual(data | -unit | bytes, goal)
+        self.assertEqual(goal | unit | bytes, data)
+
+    def test_multiple_blocks(self):
+        data = b'Binary Refinery XXTEA with an arithmetic shift right!!!!'
+        goal = bytes.fromhex(
+            '97021571f5f02a7f7c332039d03800204a3ef57de1587e6710e64fe339dc3f3a9daf2ce54e447199'
+            '110c18e75c0e15f24b2710cefd2792ba')
+        unit = self.load(b'0123456789abcdef', raw=True, block_size=2)
+        self.assertEqual(data | -unit | bytes, goal)
+        self.assertEqual(goal | unit | bytes, data)
+
+    def test_roundtrip_with_pkcs7(self):
+        data = b'This is a secret message.'
+        unit = self.load(b'0123456789abcdef', padding='pkcs7')
+        self.assertEqual(data, data | -unit | unit | bytes)
+
+    def test_roundtrip_cbc(self):
+        data = b'Binary Refinery XXTEA with an arithmetic shift right!!!!'
+        unit = self.load(b'0123456789abcdef', iv=b'iviviviv', mode='cbc', raw=True, block_size=2)
+        self.assertEqual(data, data | -unit | unit | bytes)
@@ -7,3 +7,8 @@ class TestBase62(TestUnitBase):
         unit = self.load()
         data = 'VJGSuERgCoVhl6mJg1x87faFOPIqacI3Eby4oP5MyBYKQy5paDF'
         self.assertEqual(data | unit | bytes, B'flag{4b676ccc1070be66b1a15dB601c8d500}')
+
+    def test_base62_roundtrip(self):
+        unit = self.load()
+        data = B'\x01' + self.generate_random_buffer(2000)
+        self.assertEqual(data | -unit | unit | bytes, data)
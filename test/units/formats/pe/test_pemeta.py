@@ -118,3 +118,10 @@ class TestPEMeta(TestUnitBase):
         self.assertEqual(test['Version']['ProductName'], 'rewrwr')
         self.assertEqual(test['Version']['ProductVersion'], '7.4.1.7')
         self.assertEqual(test['Version']['AssemblyVersion'], '4.2.6.1')
+
+    def test_dll_suffix_is_stripped(self):
+        from refinery.units.formats.pe.pemeta import _STRING
+        self.assertEqual(_STRING('KERNEL32.dll', True), 'KERNEL32')
+        self.assertEqual(_STRING(b'user32.DLL\0junk', True), 'user32')
+        self.assertEqual(_STRING('KERNEL32.dll'), 'KERNEL32.dll')
+        self.assertEqual(_STRING('dll', True), 'dll')
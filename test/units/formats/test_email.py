@@ -134,3 +134,41 @@ class TestEmailUnpacker(TestUnitBase):
             'end': '2025-06-15 11:30:00+00:00',
             'location': 'Planet Gunsmoke',
         })
+
+    def test_8bit_latin1_with_large_attachment(self):
+        attachment = bytes(range(256)) * 0x400
+        data = (
+            'From: Eike <eike@example.com>\n'
+            'To: Jesko <jesko@example.com>\n'
+            'Subject: Gr\xFC\xDFe\n'
+            'MIME-Version: 1.0\n'
+            'Content-Type: multipart/mixed; boundary="XX"\n'
+            '\n'
+            '--XX\n'
+            'Content-Type: text/plain; charset=iso-8859-1\n'
+            'Content-Transfer-Encoding: 8bit\n'
+            '\n'
+            'Gr\xFC\xDFe aus M\xFCnchen\n'
+            '--XX\n'
+            'Content-Type: application/octet-stream\n'
+            'Content-Disposition: attachment; filename="blob.bin"\n'
+            'Content-Transfer-Encoding: base64\n'
+            '\n'
+            F'{base64.encodebytes(attachment).decode()}'
+            '--XX--\n'
+        ).encode('latin1')
+        body = data | self.load('body.txt') | bytes
+        self.assertEqual(body.decode('latin1').rstrip(), 'Gr\xFC\xDFe aus M\xFCnchen')
+        self.assertEqual(data | self.load('attachments/blob.bin') | bytes, attachment)
+
+    def test_7bit_message(self):
+        data = (
+            B'From: eike@example.com\n'
+            B'Subject: =?utf-8?q?Gr=C3=BC=C3=9Fe?=\n'
+            B'Content-Type: text/plain\n'
+            B'\n'
+            B'Hello\n'
+        )
+        headers = data | self.load('headers.json') | json.loads
+        self.assertEqual(headers['Subject'], 'Gr\xFC\xDFe')
+        self.assertEqual(data | self.load('body.txt') | str, 'Hello\n')
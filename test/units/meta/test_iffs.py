@@ -16,3 +16,7 @@ class TestIfStr(TestUnitBase):
     def test_nocase_02(self):
         pl = L('emit raffle WAFFLE rattle BATTLE cattle settle') [ self.load('bat') ]
         self.assertEqual(pl(), B'')
+
+    def test_nocase_non_letters(self):
+        pl = L('emit h:41DB5B00 h:61FB7B00 h:61DB5B00') [ self.load('h:61db5b', nocase=True) ]
+        self.assertEqual(pl(), bytes.fromhex('41DB5B00 61DB5B00'))
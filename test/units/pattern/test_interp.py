@@ -46,3 +46,12 @@ class TestCarve(TestUnitBase):
         data = struct.pack("<IIII", i1, i2, i3, i4)
         result = unit(data)
         self.assertEqual(result.decode(Unit.codec), f"{i1},{i2}\n{i3},{i4}")
+
+    def test_mixed_byte_order(self):
+        unit = self.load("{<H}:{>H};")
+        data = struct.pack("<H", 1) + struct.pack(">H", 2)
+        self.assertEqual(unit(data * 2).decode(Unit.codec), "1:2;1:2;")
+
+    def test_percent_in_separator(self):
+        unit = self.load("{<B}%s{<B}%")
+        self.assertEqual(unit(bytes((1, 2))).decode(Unit.codec), "1%s2%")
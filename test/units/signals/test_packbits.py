@@ -25,3 +25,8 @@ class TestPackbits(TestUnitBase):
         unit = self.load("h:AA", bit_width=2, bit_order="lsb")
         data = B'\x00' * 4 + B'\x03' * 4 + B'\xAA' + B'\x00' * 2 + B'\x03' * 2
         self.assertEqual(unit.process(data), B'\x00\xFF\xAA\xF0')
+
+    def test_partial_groups(self):
+        unit = self.load("h:AA", bit_width=1, bit_order="msb")
+        data = B'\x01' * 3 + B'\xAA' + B'\x01' * 9
+        self.assertEqual(unit.process(data), B'\xE0\xAA\xFF')
@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import numpy as np
+
+from .. import TestUnitBase
+
+
+class TestPulses(TestUnitBase):
+
+    def _pulses(self, keep: str, threshold):
+        data = np.array([10, 10, 0, 10, 0, 0], dtype=np.float32).tobytes()
+        return np.frombuffer(self.load(threshold=threshold, keep=keep).process(data), dtype=np.float32).tolist()
+
+    def test_threshold_above_one(self):
+        self.assertEqual(self._pulses('both', 5), [2, 1, 1, 2])
+        self.assertEqual(self._pulses('hi', 5), [2, 1])
+        self.assertEqual(self._pulses('lo', 5), [1, 2])
+
+    def test_threshold_below_zero(self):
+        data = np.array([-3, 1, 1, -3], dtype=np.float32).tobytes()
+        unit = self.load(threshold=-1, keep='hi')
+        self.assertEqual(np.frombuffer(unit.process(data), dtype=np.float32).tolist(), [2])
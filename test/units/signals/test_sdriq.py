@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import struct
+import zlib
+
+import numpy as np
+
+from refinery.lib.frame import Chunk
+
+from .. import TestUnitBase
+
+
+class TestSdriq(TestUnitBase):
+
+    def _header(self, sample_size: int) -> bytes:
+        header = struct.pack('<IQQIII', 48000, 433920000, 1700000000, sample_size, 0, 0)
+        return header[:-4] + struct.pack('<I', zlib.crc32(header[:-4]))
+
+    def test_interleaved_samples(self):
+        for sample_size, dtype in ((16, np.int16), (24, np.int32)):
+            samples = np.array([1, -2, 3, -4, 32000, -32000], dtype=dtype)
+            unit = self.load(ignore_checksum=False)
+            result = unit.process(self._header(sample_size) + samples.tobytes())
+            sig = np.frombuffer(result, dtype=np.complex64)
+            self.assertEqual(sig.tolist(), [1 - 2j, 3 - 4j, 32000 - 32000j])
+            self.assertEqual(result.meta['sample_rate'], 48000)
+            self.assertEqual(result.meta['center_freq'], 433920000)
+            self.assertEqual(result.meta['sample_size'], sample_size)
+
+    def test_roundtrip(self):
+        for sample_size, dtype in ((16, np.int16), (24, np.int32)):
+            data = self._header(sample_size) + np.arange(-8, 8, dtype=dtype).tobytes()
+            unit = self.load(ignore_checksum=False)
+            self.assertEqual(bytes(unit.reverse(Chunk(unit.process(data)))), data)
+
+    def test_invalid_checksum(self):
+        data = bytearray(self._header(16))
+        data[0] ^= 1
+        with self.assertRaises(RuntimeError):
+            self.load(ignore_checksum=False).process(data)
+
+    def test_reverse_saturates(self):
+        for sample_size, dtype in ((16, np.int16), (24, np.int32)):
+            limit = 1 << (sample_size - 1)
+            sig = np.array([40000 - 40000j, 3e9 - 3e9j, 1.5 - 1.5j], dtype=np.complex64)
+            data = Chunk(sig.tobytes())
+            data.meta.update(dict(sample_rate=1, center_freq=0, timestamp=0, sample_size=sample_size))
+            result = self.load(ignore_checksum=False).reverse(data)
+            samples = np.frombuffer(result, dtype=dtype, offset=32).tolist()
+            if sample_size == 16:
+                self.assertEqual(samples[:2], [limit - 1, -limit])
+            else:
+                self.assertEqual(samples[:2], [40000, -40000])
+            self.assertEqual(samples[2:4], [limit - 1, -limit])
+            self.assertEqual(samples[4:], [1, -1])
@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import numpy as np
+
+from .. import TestUnitBase
+
+
+class TestSigan(TestUnitBase):
+
+    def test_frequency_wraps_phase_jumps(self):
+        phase = np.array([3.0, -3.0, -1.0, 2.5, -2.5], dtype=np.float64)
+        sig = np.exp(1j * phase).astype(np.complex64)
+        unit = self.load()
+        amplitude, angle, frequency = [
+            np.frombuffer(chunk, dtype=np.float32) for chunk in unit.process(sig.tobytes())]
+        self.assertTrue(np.allclose(amplitude, 1, atol=1e-6))
+        self.assertTrue(np.allclose(angle, phase, atol=1e-6))
+        expected = np.diff(np.unwrap(phase))
+        self.assertTrue(np.allclose(frequency, expected, atol=1e-5))
+        self.assertEqual(frequency.dtype, np.float32)
@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from refinery.lib.frame import Chunk
+
+from .. import TestUnitBase
+
+
+class TestSigsnip(TestUnitBase):
+
+    def test_samples_for_each_chunk(self):
+        unit = self.load('1:3')
+        data = bytes(range(40))
+        for _ in range(2):
+            self.assertEqual(unit(data), data[8:24])
+
+    def test_seconds(self):
+        data = Chunk(bytes(range(80)))
+        data.meta['sample_rate'] = 2
+        unit = self.load('0.5:1.5', seconds=True)
+        self.assertEqual(bytes(next(unit.process(data))), bytes(range(8, 24)))